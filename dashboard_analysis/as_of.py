@@ -0,0 +1,133 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from summary import compute_summary_state
+from monetary_policy import compute_policy_state
+from fiscal_n_debt import build_debt_stability_df, compute_debt_state
+from dataset_schema import dataset_version
+
+# ----------------------------------
+# Point-in-time (as-of) dashboard state
+# ----------------------------------
+# One row per month holding every KPI, stance and narrative input the tabs
+# display, computed only from data up to that month. Built once at ETL time
+# so scrubbing through history in the dashboard is a lookup, not a recompute.
+# The table is tagged with the dataset version it was built from and is only
+# used against that same dataset.
+
+STATE_FILE = os.path.join("data", "dashboard_state.csv")
+VERSION_COLUMN = "dataset_version"
+
+# Months of history required before a month can be replayed
+# (YoY debt growth needs 12 prior observations)
+MIN_HISTORY = 13
+
+_worker_df = None
+
+
+def compute_month_state(df, as_of):
+    """
+    Compute the state of every tab as it would have been rendered on as_of
+    """
+    hist = df.loc[:as_of]
+
+    tab_states = {
+        "summary": compute_summary_state(hist),
+        "monetary": compute_policy_state(hist),
+        "debt": compute_debt_state(build_debt_stability_df(hist)),
+    }
+
+    state = {"date": hist.index[-1]}
+    for tab, tab_state in tab_states.items():
+        for key, value in tab_state.items():
+            state[f"{tab}.{key}"] = value
+    return state
+
+
+def _init_worker(df):
+    # Ship the frame once per worker instead of once per month
+    global _worker_df
+    _worker_df = df
+
+
+def _worker_month_state(as_of):
+    return compute_month_state(_worker_df, as_of)
+
+
+def replay_months(df):
+    """
+    Months that have enough history to be replayed
+    """
+    return df.index[MIN_HISTORY - 1:]
+
+
+def build_state_table(df, max_workers=None):
+    """
+    Build the per-month state table in parallel across a process pool,
+    tagged with the dataset version of df
+    """
+    df = df.sort_index()
+    months = replay_months(df)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(df,),
+    ) as pool:
+        chunksize = max(1, len(months) // ((max_workers or os.cpu_count() or 1) * 4))
+        rows = list(pool.map(_worker_month_state, months, chunksize=chunksize))
+
+    table = pd.DataFrame(rows).set_index("date").sort_index()
+    table[VERSION_COLUMN] = dataset_version(df)
+    return table
+
+
+def load_state_table(file_path=STATE_FILE, version=None):
+    """
+    Load a precomputed state table, or None if it has not been built.
+    When version is given, also None if the table was built from another
+    dataset version (the tabs then compute their state live).
+    """
+    if not os.path.exists(file_path):
+        return None
+    table = pd.read_csv(file_path, index_col="date", parse_dates=["date"], dtype={VERSION_COLUMN: str})
+
+    if version is not None and (
+        VERSION_COLUMN not in table.columns or (table[VERSION_COLUMN] != version).any()
+    ):
+        return None
+    return table.drop(columns=VERSION_COLUMN, errors="ignore")
+
+
+def state_for(table, as_of):
+    """
+    Look up the precomputed tab states for as_of, keyed by tab name.
+    Returns None when the month is not in the table.
+    """
+    if table is None or as_of not in table.index:
+        return None
+
+    states = {}
+    for key, value in table.loc[as_of].items():
+        tab, field = key.split(".", 1)
+        states.setdefault(tab, {})[field] = value
+    return states
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute the as-of dashboard state table")
+    parser.add_argument("data_path", nargs="?", default=os.path.join("data", "cleaned_full_data.csv"))
+    parser.add_argument("out_path", nargs="?", default=STATE_FILE)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.data_path, parse_dates=["date"])
+    df = df.set_index("date").sort_index()
+
+    table = build_state_table(df, max_workers=args.workers)
+    table.to_csv(args.out_path, index=True)
+
+    print(f"Saved {len(table)} monthly states to {args.out_path}")
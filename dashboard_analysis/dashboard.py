@@ -7,6 +7,10 @@ import os
 from summary import summary_tab
 from monetary_policy import monetary_policy_tab
 from fiscal_n_debt import render_debt_stability_tab
+from as_of import MIN_HISTORY, load_state_table, state_for
+from dataset_schema import dataset_version
+from forecasting import forecast_for, load_forecasts
+from query import MacroQuery
 # ----------------------------------
 # Page configuration
 # ----------------------------------
@@ -35,7 +39,58 @@ def load_data():
     df = df.set_index("date").sort_index()
     return df
 
-df = load_data()
+@st.cache_resource
+def load_query():
+    # Shared, read-only index over the dataset; widget changes query views of it
+    return MacroQuery(load_data())
+
+@st.cache_data
+def load_states():
+    # Precomputed by as_of.py at ETL time; None if built from another dataset version
+    return load_state_table(version=dataset_version(load_data()))
+
+@st.cache_data
+def load_forecast_bands():
+    # Fitted offline by forecasting.py at ETL time; None if fitted on another dataset version
+    return load_forecasts(version=dataset_version(load_data()))
+
+query = load_query()
+state_table = load_states()
+forecasts = load_forecast_bands()
+
+# ----------------------------------
+# Sidebar: date range (end = as-of replay) and series picker
+# ----------------------------------
+st.sidebar.header("Filters")
+months = list(query.index)
+start_date, as_of_date = st.sidebar.select_slider(
+    "Date range (dashboard shown as of the end date)",
+    options=months,
+    value=(months[0], months[-1]),
+    format_func=lambda d: f"{d:%b %Y}"
+)
+
+first_replay = months[min(MIN_HISTORY, len(months)) - 1]
+if as_of_date < first_replay:
+    st.sidebar.warning(
+        f"At least {MIN_HISTORY} months of history are needed; showing as of {first_replay:%b %Y}."
+    )
+    as_of_date = first_replay
+
+if state_table is None:
+    st.sidebar.info("No precomputed state for this dataset version; KPIs are computed live.")
+
+picked_series = st.sidebar.multiselect("Series explorer", options=query.columns)
+
+# Every tab only sees data up to the as-of month (a view, not a copy);
+# charts and tables start at start_date
+df = query.rows(end=as_of_date)
+explorer = query.select(picked_series, start_date, as_of_date)
+states = state_for(state_table, as_of_date) or {}
+
+# Forecast bands start after the latest month, so only show them there
+if as_of_date != query.end:
+    forecasts = None
 
 # ----------------------------------
 # Tabs (Macro Transmission Channels)
@@ -53,18 +108,27 @@ tabs = st.tabs([
 # Tab 0: Summary
 # ==================================
 with tabs[0]:
-    summary_tab(df)
+    summary_tab(df, states.get("summary"), explorer)
     
 # ==================================
 # 🟦 Tab 1: Monetary & Inflation
 # ==================================
 with tabs[1]:
-    monetary_policy_tab(df)
+    monetary_policy_tab(df, states.get("monetary"), {
+        "Base Rate (%)": forecast_for(forecasts, "base_rate"),
+        "CPI Inflation (YoY %)": forecast_for(forecasts, "Total item"),
+    }, start_date, var_forecasts={
+        "Base Rate (%)": forecast_for(forecasts, "base_rate", model="var"),
+        "CPI Inflation (YoY %)": forecast_for(forecasts, "Total item", model="var"),
+    })
 
 # ==================================
 # 🟩 Tab 2: Fiscal & Government Debt
 # ==================================
 with tabs[2]:
-    render_debt_stability_tab(df)   
+    render_debt_stability_tab(df, states.get("debt"), {
+        "household_debt": forecast_for(forecasts, "Present Debt of Household"),
+        "corporate_debt": forecast_for(forecasts, "Financial Corporations -   Domestic Currency"),
+    }, start_date)
 
 
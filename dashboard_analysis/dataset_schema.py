@@ -0,0 +1,70 @@
+import hashlib
+
+import pandas as pd
+
+# ----------------------------------
+# Dataset schema & version
+# ----------------------------------
+# Shared by the dashboard and the ETL in data/, so it only depends on pandas:
+# the ETL imports it without pulling in Streamlit, plotly or statsmodels.
+# The column lists are what the tabs read; data_validation.py checks the
+# cleaned sources against them.
+
+# Headline series on the Summary tab
+SUMMARY_COLUMNS = {
+    "rate": "base_rate",
+    "cpi": "Total item",
+    "gdp": "Gross domestic product at market prices(GDP)",
+    "debt": "govt_debt_to_gdp"
+}
+
+# Monetary & Inflation tab
+CPI_COMPONENTS = [
+    'Alcoholic beverages and tobacco',
+    'Clothing and footwear',
+    'Communication',
+    'Education',
+    'Food and non-alcoholic beverages',
+    'Furnishings, household equipment and routine household maintenance',
+    'Health',
+    'Housing, water, electricity and other fuels',
+    'Miscellaneous goods and services',
+    'Recreation and culture',
+    'Restaurants and hotels',
+    'Transport'
+]
+
+GDP_SECTORS = ['Accommodation and food services', 'Arts, sports and recreation', 
+               'Basic metals', 'Building repair', 'Business support services', 
+               'Chemicals and chemical products', 'Coke and refined petroleum products', 
+               'Communication', 'Computer, electronic and optical products', 'Electrical equipment',
+               'Fabricated metal products', 'Food, beverages products', 'Machinery and equipment', 
+               'Non-metallic mineral products', 'Non-residential building construction', 
+               'Other manufacturing, repair and installation of machinery and equipment', 
+               'Professional, scientific and technical services', 'Publishing, broadcasting, motion picture, video and television programme production, and information service', 
+               'Residential building construction', 'Textile and leather products', 'Transportation equipment', 'Wholesale and retail trade', 
+               'Wood and paper products, printing and reproduction of recorded media', 'Building construction and repair', 'Business activities', 
+               'Civil engineering', 'Cultural and other services', 'Education', 'Electricity', 'Finance and insurance', 'Gas, steam and air conditioning supply', 
+               'Human health and social work', 'Information and communication', 'Manufacturing', 'Public administration, defence and social security', 'Real estate', 
+               'Transportation and storage', 'Water supply, sewerage, waste management and remediation activities', 'Wholesale and retail trade, accommodation and food services', 
+               'Agriculture, forestry and fishing', 'Construction', 'Electricity, gas and water supply', 'Gross domestic product at market prices(GDP)', 'Gross national income(GNI)', 
+               'Mining, quarrying and Manufacturing', 'Net factor income from the rest of the world'
+]
+
+# Fiscal & Debt tab (build_debt_stability_df name -> source column)
+DEBT_COLUMNS = {
+    "household_debt": "Present Debt of Household",
+    "corporate_debt": "Financial Corporations -   Domestic Currency",
+    "gdp": "Gross domestic product at market prices(GDP)"
+}
+
+
+def dataset_version(df):
+    """
+    Content hash of the dataset; keys vintages, model caches, state tables
+    and static exports
+    """
+    hashed = pd.util.hash_pandas_object(df, index=True).values
+    digest = hashlib.sha256(hashed.tobytes())
+    digest.update("|".join(map(str, df.columns)).encode())
+    return digest.hexdigest()[:16]
@@ -0,0 +1,362 @@
+import argparse
+import html
+import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+import plotly.express as px
+from plotly.offline import get_plotlyjs
+
+from summary import compute_summary_state, key_takeaways, summary_narrative
+from monetary_policy import (
+    REGIME_MESSAGES,
+    add_forecast_band,
+    base_rate_cpi_figure,
+    compute_policy_state,
+    cpi_breakdown_table,
+    policy_actions_table,
+    policy_interpretation,
+    sector_growth_table,
+    zscore_signals,
+)
+from fiscal_n_debt import build_debt_stability_df, compute_debt_state
+from dataset_schema import dataset_version
+from forecasting import FORECAST_FILE, MODEL_CACHE_FILE, forecast_for, load_forecasts
+
+# ----------------------------------
+# Static snapshot export
+# ----------------------------------
+# Renders the Summary, Monetary and Fiscal & Debt tabs to plain HTML for one
+# dataset version (and set of forecast bands), so read-only stakeholders can be
+# served static files and Streamlit sessions are left to interactive users.
+# Tabs are built in parallel across a process pool, then every figure is
+# serialised in the same pool.
+
+EXPORT_DIR = "exports"
+
+TABS = {
+    "summary": ("index.html", "Summary"),
+    "monetary": ("monetary.html", "🟦 Monetary & Inflation"),
+    "fiscal": ("fiscal.html", "🟩 Fiscal & Debt"),
+}
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title} – South Korea Macroeconomic Dashboard</title>
+<script src="plotly.min.js"></script>
+<style>
+body {{ font-family: sans-serif; margin: 2rem auto; max-width: 1200px; padding: 0 1rem; color: #262730; }}
+nav a {{ margin-right: 1.5rem; }}
+nav a.active {{ font-weight: bold; }}
+.metrics {{ display: flex; flex-wrap: wrap; gap: 2rem; margin: 1rem 0; }}
+.metric .label {{ font-size: 0.85rem; color: #555; }}
+.metric .value {{ font-size: 1.8rem; }}
+.metric .delta {{ font-size: 0.9rem; color: #555; }}
+.alert {{ padding: 0.8rem 1rem; border-radius: 0.4rem; margin: 1rem 0; }}
+.info {{ background: #e8f0fe; }} .success {{ background: #e6f4ea; }} .error {{ background: #fce8e6; }}
+table {{ border-collapse: collapse; font-size: 0.85rem; }}
+td, th {{ border: 1px solid #ddd; padding: 0.25rem 0.5rem; }}
+.caption {{ font-size: 0.85rem; color: #555; }}
+</style>
+</head>
+<body>
+<h1>🇰🇷 South Korea Macroeconomic Dashboard (2018–2025)</h1>
+<p class="caption">Static snapshot as of {as_of} · dataset version {version}</p>
+<nav>{nav}</nav>
+<hr>
+{body}
+</body>
+</html>
+"""
+
+_worker_data = None
+
+
+# ----------------------------------
+# HTML building blocks
+# ----------------------------------
+def _markdown(text):
+    """
+    Render the small markdown subset the tab narratives use (bold, bullets)
+    """
+    lines = [line.strip() for line in text.strip().splitlines()]
+    if lines and all(line.startswith("- ") for line in lines):
+        body = "<ul>" + "".join(f"<li>{html.escape(line[2:])}</li>" for line in lines) + "</ul>"
+    else:
+        body = html.escape(" ".join(lines))
+    return re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", body)
+
+
+def _heading(text, level=2):
+    return ("html", f"<h{level}>{html.escape(text)}</h{level}>")
+
+
+def _alert(level, message):
+    return ("html", f'<div class="alert {level}">{_markdown(message)}</div>')
+
+
+def _metrics(items):
+    cells = []
+    for label, value, delta in items:
+        delta_html = f'<div class="delta">{html.escape(delta)}</div>' if delta else ""
+        cells.append(
+            f'<div class="metric"><div class="label">{html.escape(label)}</div>'
+            f'<div class="value">{html.escape(value)}</div>{delta_html}</div>'
+        )
+    return ("html", '<div class="metrics">' + "".join(cells) + "</div>")
+
+
+def _table(df):
+    return ("html", df.to_html(float_format=lambda x: f"{x:,.2f}", border=0))
+
+
+def _caption(text):
+    return ("html", f'<p class="caption">{html.escape(text)}</p>')
+
+
+def _line(data, title):
+    return ("figure", px.line(data, title=title))
+
+
+# ----------------------------------
+# Tab pages (same helpers as the Streamlit tabs)
+# ----------------------------------
+def summary_blocks(df, forecasts):
+    state = compute_summary_state(df)
+    return [
+        _heading("🇰🇷 Korea Macro Summary"),
+        _heading(f"📅 As of {state['as_of']}", 4),
+        _metrics([
+            ("BOK Base Rate (%)", f"{state['rate_now']:.2f}", f"{state['rate_change']:+.2f} MoM"),
+            ("CPI Inflation (YoY %)", f"{state['cpi_now']:.2f}", f"{state['cpi_change']:+.2f} MoM"),
+            ("GDP", f"{state['gdp_now']:.2f}", f"{state['gdp_change_quarterly']:+.2f} QoQ"),
+            ("Govt Debt / GDP (%)", f"{state['debt_now']:.1f}", f"{state['debt_change_quarterly']:+.1f} QoQ"),
+        ]),
+        _heading("📌 Key Takeaways", 3),
+        ("html", _markdown(key_takeaways(state))),
+        _alert("info", summary_narrative(state)),
+    ]
+
+
+def monetary_blocks(df, forecasts):
+    state = compute_policy_state(df)
+    d_real = state["d_real_rate"]
+    arrow = "🔺" if d_real > 0.10 else "🔻" if d_real < -0.10 else "➡️"
+
+    blocks = [
+        _heading("Monetary Policy (Bank of Korea)"),
+        _heading("Monetary Policy & Inflation Targeting", 3),
+        ("figure", base_rate_cpi_figure(df, {
+            "Base Rate (%)": forecast_for(forecasts, "base_rate"),
+            "CPI Inflation (YoY %)": forecast_for(forecasts, "Total item"),
+        })),
+    ]
+
+    actions = policy_actions_table(df)
+    if not actions.empty:
+        blocks += [_heading("📌 Monetary Policy Actions & Real Stance", 3), _table(actions)]
+
+    blocks += [
+        _metrics([
+            ("As of Date", state["as_of"], None),
+            ("BOK Base Rate", f"{state['base_rate']:.2f}%", f"{state['d_base_rate']:+.2f} MoM"),
+            ("CPI Inflation (YoY)", f"{state['Total item']:.2f}%", f"{state['d_cpi']:+.2f} MoM"),
+            ("Real Policy Rate", f"{state['real_rate']:.2f}%", f"{d_real:+.2f} MoM {arrow}"),
+            ("Policy Stance", state["stance"], None),
+        ]),
+        _heading("Policy Interpretation", 3),
+        _alert(*policy_interpretation(d_real)),
+        _heading("Standardised Macro Signals (Z-Score)", 3),
+        _line(zscore_signals(df), "Inflation Expectations vs Actual Inflation"),
+        _caption("Policy credibility improves when inflation expectations stabilise despite elevated CPI."),
+        _heading("Inflation Breakdown (Latest YoY %)", 3),
+        _table(cpi_breakdown_table(df)),
+        _heading("Growth by Sector (3-Month % Change)", 3),
+        _table(sector_growth_table(df)),
+        _heading("Macro–Policy Regime Summary", 3),
+        _alert(*REGIME_MESSAGES[state["regime"]]),
+    ]
+    return blocks
+
+
+def fiscal_blocks(df, forecasts):
+    debt = build_debt_stability_df(df)
+    state = compute_debt_state(debt)
+
+    levels = []
+    for key, title, band in [
+        ("household_debt", "Household Debt (Monthly)", forecast_for(forecasts, "Present Debt of Household")),
+        ("corporate_debt", "Corporate Debt", forecast_for(forecasts, "Financial Corporations -   Domestic Currency")),
+    ]:
+        fig = px.line(debt[key], title=title)
+        if band is not None:
+            add_forecast_band(fig, band, key)
+        levels.append(("figure", fig))
+
+    blocks = [
+        _heading("Debt & Financial Stability"),
+        _heading("Leverage Levels", 3),
+        levels[0],
+        _metrics([("Latest Household Debt", f"{state['latest_hh']:,.0f}", f"{state['hh_yoy']:.2f}% YoY")]),
+        levels[1],
+        _metrics([("Latest Corporate Debt", f"{state['latest_corp']:,.0f}", f"{state['corp_yoy']:.2f}% YoY")]),
+    ]
+
+    if "hh_debt_to_gdp" in debt.columns:
+        blocks += [
+            _heading("Debt Sustainability", 3),
+            _line(debt[["hh_debt_to_gdp", "corp_debt_to_gdp"]], "Debt-to-GDP"),
+            _caption("Debt-to-GDP ratios measure whether leverage is supported by income."),
+        ]
+
+    blocks += [
+        _heading("Momentum & Financial Stress", 3),
+        _line(debt[["hh_debt_yoy", "gdp_yoy"]], "Debt Growth vs Income Growth"),
+        _metrics([("Debt – Income Growth Spread", f"{state['spread']:.2f} pp", None)]),
+        _line(debt["hh_debt_accel"], "Household Debt Acceleration"),
+        _caption("Positive acceleration = leverage risk building"),
+        _heading("Policy Interpretation", 3),
+        _alert("info", state["interpretation"]),
+    ]
+    return blocks
+
+
+TAB_BUILDERS = {
+    "summary": summary_blocks,
+    "monetary": monetary_blocks,
+    "fiscal": fiscal_blocks,
+}
+
+
+# ----------------------------------
+# Parallel rendering
+# ----------------------------------
+def _init_worker(df, forecasts):
+    global _worker_data
+    _worker_data = (df, forecasts)
+
+
+def _build_tab(tab):
+    df, forecasts = _worker_data
+    return tab, TAB_BUILDERS[tab](df, forecasts)
+
+
+def _render_figure(fig):
+    return fig.to_html(full_html=False, include_plotlyjs=False)
+
+
+def _page(tab, body, as_of, version):
+    nav = "".join(
+        f'<a href="{file}" class="{"active" if name == tab else ""}">{html.escape(title)}</a>'
+        for name, (file, title) in TABS.items()
+    )
+    return PAGE.format(title=TABS[tab][1], as_of=as_of, version=version, nav=nav, body=body)
+
+
+def snapshot_name(df, forecasts=None):
+    """
+    Snapshot directory name: the dataset version, plus the version of the
+    forecast bands drawn on it so a refit is never served from an old snapshot
+    """
+    version = dataset_version(df)
+    if forecasts is None:
+        return version
+    return f"{version}-{dataset_version(forecasts)}"
+
+
+def _write_latest(out_dir, name):
+    # Pointer to the current snapshot for whatever serves the static files
+    path = os.path.join(out_dir, "LATEST")
+    with open(path + ".tmp", "w") as f:
+        f.write(name + "\n")
+    os.replace(path + ".tmp", path)
+
+
+def export_snapshot(df, out_dir=EXPORT_DIR, forecasts=None, max_workers=None, force=False):
+    """
+    Render every tab to static HTML under out_dir/<snapshot name>/ and point
+    LATEST at it. forecasts must have been fitted on df (see
+    load_forecasts(version=...)). Returns the snapshot directory; an existing
+    snapshot is reused unless force.
+    """
+    df = df.sort_index()
+    version = dataset_version(df)
+    name = snapshot_name(df, forecasts)
+    snapshot_dir = os.path.join(out_dir, name)
+
+    # Snapshots only appear under <name>/ once complete (see os.replace below)
+    if os.path.isdir(snapshot_dir) and not force:
+        _write_latest(out_dir, name)
+        return snapshot_dir
+    os.makedirs(out_dir, exist_ok=True)
+
+    pages = {}
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(df, forecasts),
+    ) as pool:
+        # Tabs build in parallel; each finished tab queues its figures
+        figure_futures = {}
+        for future in as_completed([pool.submit(_build_tab, tab) for tab in TABS]):
+            tab, blocks = future.result()
+            pages[tab] = blocks
+            for i, (kind, content) in enumerate(blocks):
+                if kind == "figure":
+                    figure_futures[(tab, i)] = pool.submit(_render_figure, content)
+
+        for (tab, i), future in figure_futures.items():
+            pages[tab][i] = ("html", future.result())
+
+    # Write into a temporary directory and move it into place in one rename,
+    # so a crash mid-write never leaves a partial snapshot to be reused
+    tmp_dir = tempfile.mkdtemp(prefix=f".{name}-", dir=out_dir)
+    try:
+        as_of = df.index[-1].strftime("%B %Y")
+        for tab, blocks in pages.items():
+            body = "\n".join(content for _, content in blocks)
+            with open(os.path.join(tmp_dir, TABS[tab][0]), "w", encoding="utf-8") as f:
+                f.write(_page(tab, body, as_of, version))
+
+        with open(os.path.join(tmp_dir, "plotly.min.js"), "w", encoding="utf-8") as f:
+            f.write(get_plotlyjs())
+        os.chmod(tmp_dir, 0o755)  # mkdtemp creates it private
+
+        if os.path.isdir(snapshot_dir):  # force: replace the old snapshot
+            shutil.rmtree(snapshot_dir)
+        os.replace(tmp_dir, snapshot_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    _write_latest(out_dir, name)
+    return snapshot_dir
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the dashboard tabs as static HTML")
+    parser.add_argument("data_path", nargs="?", default=os.path.join("data", "cleaned_full_data.csv"))
+    parser.add_argument("out_dir", nargs="?", default=EXPORT_DIR)
+    parser.add_argument("--forecasts", default=FORECAST_FILE)
+    parser.add_argument("--cache", default=MODEL_CACHE_FILE)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.data_path, parse_dates=["date"])
+    df = df.set_index("date").sort_index()
+
+    snapshot_dir = export_snapshot(
+        df,
+        args.out_dir,
+        # Bands fitted on another dataset version are left out
+        forecasts=load_forecasts(args.forecasts, version=dataset_version(df), cache_path=args.cache),
+        max_workers=args.workers,
+        force=args.force,
+    )
+    print(f"Static snapshot written to {snapshot_dir}")
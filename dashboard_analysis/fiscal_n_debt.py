@@ -2,11 +2,38 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 
-def render_debt_stability_tab(cleaned_full_data):
+from dataset_schema import DEBT_COLUMNS
+
+
+def with_forecast(series, band):
+    """
+    Append a forecast mean and its prediction interval to a series for st.line_chart
+    """
+    if band is None:
+        return series
+    return pd.concat([
+        series,
+        band.rename(columns={
+            "mean": f"{series.name} forecast",
+            "lower": "lower 95%",
+            "upper": "upper 95%",
+        })
+    ], axis=1)
+
+def render_debt_stability_tab(cleaned_full_data, state=None, forecasts=None, start=None):
     st.header("Debt & Financial Stability")
 
     df = build_debt_stability_df(cleaned_full_data)
 
+    forecasts = forecasts or {}
+
+    # Latest readings (precomputed when replaying history)
+    if state is None:
+        state = compute_debt_state(df)
+
+    # Charts only show rows from start; growth rates above use the full history
+    df = df.loc[start:]
+
     # =========================
     # SECTION 1: LEVELS
     # =========================
@@ -16,10 +43,10 @@ def render_debt_stability_tab(cleaned_full_data):
 
     with col1:
         st.markdown("**Household Debt (Monthly)**")
-        st.line_chart(df["household_debt"])
+        st.line_chart(with_forecast(df["household_debt"], forecasts.get("household_debt")))
 
-        latest_hh = df["household_debt"].iloc[-1]
-        hh_yoy = df["hh_debt_yoy"].iloc[-1]
+        latest_hh = state["latest_hh"]
+        hh_yoy = state["hh_yoy"]
 
         st.metric(
             label="Latest Household Debt",
@@ -29,10 +56,10 @@ def render_debt_stability_tab(cleaned_full_data):
 
     with col2:
         st.markdown("**Corporate Debt**")
-        st.line_chart(df["corporate_debt"])
+        st.line_chart(with_forecast(df["corporate_debt"], forecasts.get("corporate_debt")))
 
-        latest_corp = df["corporate_debt"].iloc[-1]
-        corp_yoy = df["corp_debt_yoy"].iloc[-1]
+        latest_corp = state["latest_corp"]
+        corp_yoy = state["corp_yoy"]
 
         st.metric(
             label="Latest Corporate Debt",
@@ -65,7 +92,7 @@ def render_debt_stability_tab(cleaned_full_data):
             df[["hh_debt_yoy", "gdp_yoy"]]
         )
 
-        spread = df["hh_debt_vs_income"].iloc[-1]
+        spread = state["spread"]
         st.metric(
             label="Debt – Income Growth Spread",
             value=f"{spread:.2f} pp"
@@ -81,28 +108,19 @@ def render_debt_stability_tab(cleaned_full_data):
     # =========================
     st.subheader("Policy Interpretation")
 
-    interpretation = generate_debt_policy_signal(df)
+    st.info(state["interpretation"])
 
-    st.info(interpretation)
 
 def build_debt_stability_df(df):
     """
     Build debt & financial stability indicators from cleaned_full_data
     """
 
-    df = df.copy()
-    df.index = pd.to_datetime(df.index)
-
-    col_map = {
-        "household_debt": "Present Debt of Household",
-        "corporate_debt": "Financial Corporations -   Domestic Currency",
-        "gdp": "Gross domestic product at market prices(GDP)"
-    }
-
-    df_debt = pd.DataFrame(index=df.index)
-    for key, col in col_map.items():
+    # Copy only the columns used here, not the full frame
+    df_debt = pd.DataFrame(index=pd.to_datetime(df.index))
+    for key, col in DEBT_COLUMNS.items():
         if col in df.columns:
-            df_debt[key] = df[col]
+            df_debt[key] = df[col].to_numpy()
 
     # --- Growth rates (YoY) ---
     df_debt["hh_debt_yoy"] = df_debt["household_debt"].pct_change(12) * 100
@@ -131,6 +149,21 @@ def build_debt_stability_df(df):
 
     return df_debt
 
+def compute_debt_state(df):
+    """
+    Collect the latest debt readings and policy narrative from build_debt_stability_df output
+    """
+
+    return {
+        "latest_hh": df["household_debt"].iloc[-1],
+        "hh_yoy": df["hh_debt_yoy"].iloc[-1],
+        "latest_corp": df["corporate_debt"].iloc[-1],
+        "corp_yoy": df["corp_debt_yoy"].iloc[-1],
+        "spread": df.get("hh_debt_vs_income", pd.Series([0])).iloc[-1],
+        "accel": df["hh_debt_accel"].iloc[-1],
+        "interpretation": generate_debt_policy_signal(df),
+    }
+
 def generate_debt_policy_signal(df):
     """
     Generate a macro-style interpretation based on debt indicators
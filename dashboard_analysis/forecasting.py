@@ -0,0 +1,246 @@
+import argparse
+import hashlib
+import json
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.api import VAR
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.exponential_smoothing.ets import ETSModel
+
+from dataset_schema import dataset_version
+
+# ----------------------------------
+# Nowcasting & forecasting of macro series
+# ----------------------------------
+# Models are fitted offline (at ETL time) and written to FORECAST_FILE, so the
+# dashboard only reads forecast bands and never pays fit latency. Fitted
+# parameters are cached in MODEL_CACHE_FILE keyed by dataset version and reused
+# without refitting for every series whose history is unchanged; any series
+# whose history changed is refitted from scratch.
+
+FORECAST_FILE = os.path.join("data", "forecasts.csv")
+MODEL_CACHE_FILE = os.path.join("data", "forecast_models.json")
+
+FORECAST_SERIES = [
+    "base_rate",
+    "Total item",
+    "Gross domestic product at market prices(GDP)",
+    "Present Debt of Household",
+    "Financial Corporations -   Domestic Currency",
+    "govt_debt_to_gdp",
+]
+
+# Small VAR on the policy / inflation / growth block (GDP enters as growth)
+VAR_SERIES = ["base_rate", "Total item", "Gross domestic product at market prices(GDP)"]
+VAR_LAGS = 2
+
+ARIMA_ORDER = (1, 1, 1)
+HORIZON = 12
+ALPHA = 0.05
+
+
+def _history_hash(values):
+    return hashlib.sha256(np.ascontiguousarray(values, dtype=float).tobytes()).hexdigest()[:16]
+
+
+def _build_model(kind, y):
+    if kind == "arima":
+        return ARIMA(y, order=ARIMA_ORDER)
+    return ETSModel(y, error="add", trend="add", damped_trend=True)
+
+
+def _forecast_frame(kind, res):
+    if kind == "arima":
+        pred = res.get_forecast(HORIZON)
+        ci = pred.conf_int(alpha=ALPHA)
+        return pd.DataFrame({
+            "mean": pred.predicted_mean,
+            "lower": ci.iloc[:, 0],
+            "upper": ci.iloc[:, 1],
+        })
+
+    pred = res.get_prediction(start=len(res.data.endog), end=len(res.data.endog) + HORIZON - 1)
+    frame = pred.summary_frame(alpha=ALPHA)
+    return pd.DataFrame({
+        "mean": frame["mean"],
+        "lower": frame["pi_lower"],
+        "upper": frame["pi_upper"],
+    })
+
+
+def _fit(kind, y):
+    model = _build_model(kind, y)
+    if kind == "ets":
+        return model.fit(disp=False)
+    return model.fit()
+
+
+def fit_series(name, y, cached=None):
+    """
+    Fit ARIMA and ETS to one series and keep the better (lower AIC) model.
+
+    cached is this series' entry from the model cache. If the history is
+    unchanged its parameters are reused without fitting; otherwise both
+    models are fitted cold. entry["fit"] records which happened per model.
+    """
+    y = y.dropna().asfreq("MS")
+    values = y.to_numpy(dtype=float)
+
+    reuse = (
+        cached is not None
+        and cached["n_obs"] == len(values)
+        and cached["history_hash"] == _history_hash(values)
+    )
+
+    candidates = {}
+    fits = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for kind in ("arima", "ets"):
+            try:
+                if reuse and kind in cached["params"]:
+                    res, how = _build_model(kind, y).smooth(np.asarray(cached["params"][kind])), "reused"
+                else:
+                    res, how = _fit(kind, y), "cold"
+            except (ValueError, np.linalg.LinAlgError):
+                continue
+            if np.isfinite(res.aic):
+                candidates[kind] = res
+                fits[kind] = how
+
+    if not candidates:
+        return None
+
+    best = min(candidates, key=lambda kind: candidates[kind].aic)
+    forecast = _forecast_frame(best, candidates[best])
+    forecast["series"] = name
+    forecast["model"] = best
+
+    entry = {
+        "n_obs": len(values),
+        "history_hash": _history_hash(values),
+        "last_date": y.index[-1].strftime("%Y-%m-%d"),
+        "best": best,
+        "aic": {kind: float(res.aic) for kind, res in candidates.items()},
+        "params": {kind: np.asarray(res.params, dtype=float).tolist() for kind, res in candidates.items()},
+        "fit": fits,
+    }
+    return name, entry, forecast
+
+
+def _fit_series_task(args):
+    return fit_series(*args)
+
+
+def fit_var(df):
+    """
+    Fit a small VAR on base rate, CPI and GDP growth and forecast HORIZON months
+    """
+    data = df[VAR_SERIES].dropna().asfreq("MS").copy()
+    gdp = VAR_SERIES[2]
+    data[gdp] = data[gdp].pct_change(3) * 100
+    data = data.dropna()
+
+    res = VAR(data).fit(VAR_LAGS)
+    mean, lower, upper = res.forecast_interval(data.values[-res.k_ar:], HORIZON, alpha=ALPHA)
+    index = pd.date_range(data.index[-1], periods=HORIZON + 1, freq="MS")[1:]
+
+    frames = []
+    for i, col in enumerate(data.columns):
+        frame = pd.DataFrame({"mean": mean[:, i], "lower": lower[:, i], "upper": upper[:, i]}, index=index)
+        # GDP is forecast as 3-month growth, not level
+        frame["series"] = f"{col} (3M growth %)" if col == gdp else col
+        frame["model"] = "var"
+        frames.append(frame)
+    return pd.concat(frames)
+
+
+def load_model_cache(file_path=MODEL_CACHE_FILE):
+    if not os.path.exists(file_path):
+        return {}
+    with open(file_path) as f:
+        return json.load(f)
+
+
+def run_forecasts(df, cache=None, max_workers=None):
+    """
+    Fit every forecast series in parallel and return (forecasts, updated cache)
+    """
+    df = df.sort_index()
+    cache = cache or {}
+    cached_series = cache.get("series", {})
+    series = [col for col in FORECAST_SERIES if col in df.columns]
+
+    tasks = [(col, df[col], cached_series.get(col)) for col in series]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        results = [r for r in pool.map(_fit_series_task, tasks) if r is not None]
+
+    frames = [forecast for _, _, forecast in results]
+    if all(col in df.columns for col in VAR_SERIES):
+        frames.append(fit_var(df))
+
+    forecasts = pd.concat(frames)
+    forecasts.index.name = "date"
+    forecasts = forecasts[["series", "model", "mean", "lower", "upper"]]
+
+    new_cache = {
+        "dataset_version": dataset_version(df),
+        "series": {name: entry for name, entry, _ in results},
+    }
+    return forecasts, new_cache
+
+
+def load_forecasts(file_path=FORECAST_FILE, version=None, cache_path=MODEL_CACHE_FILE):
+    """
+    Load precomputed forecasts, or None if they have not been built.
+    When version is given, also None if the model cache at cache_path was
+    fitted on another dataset version.
+    """
+    if not os.path.exists(file_path):
+        return None
+    if version is not None and load_model_cache(cache_path).get("dataset_version") != version:
+        return None
+    return pd.read_csv(file_path, index_col="date", parse_dates=["date"])
+
+
+def forecast_for(forecasts, series, model=None):
+    """
+    Forecast band for one series; model=None picks the univariate best fit
+    """
+    if forecasts is None:
+        return None
+    rows = forecasts[forecasts["series"] == series]
+    rows = rows[rows["model"] == model] if model else rows[rows["model"] != "var"]
+    if rows.empty:
+        return None
+    return rows[["mean", "lower", "upper"]]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fit forecast models and write forecast bands")
+    parser.add_argument("data_path", nargs="?", default=os.path.join("data", "cleaned_full_data.csv"))
+    parser.add_argument("out_path", nargs="?", default=FORECAST_FILE)
+    parser.add_argument("--cache", default=MODEL_CACHE_FILE)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.data_path, parse_dates=["date"])
+    df = df.set_index("date").sort_index()
+
+    cache = load_model_cache(args.cache)
+    version = dataset_version(df)
+
+    if cache.get("dataset_version") == version and os.path.exists(args.out_path):
+        print(f"Forecasts already up to date for dataset version {version}")
+    else:
+        forecasts, cache = run_forecasts(df, cache, max_workers=args.workers)
+        forecasts.to_csv(args.out_path, index=True)
+        with open(args.cache, "w") as f:
+            json.dump(cache, f, indent=2)
+
+        fits = {name: entry["fit"] for name, entry in cache["series"].items()}
+        print(f"Saved {forecasts['series'].nunique()} forecasts to {args.out_path} ({fits})")
@@ -0,0 +1,498 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from datetime import datetime, timezone
+
+import numpy as np
+import psutil
+
+# ----------------------------------
+# Concurrent-session load test
+# ----------------------------------
+# Starts dashboard.py on a local headless Streamlit server and drives N
+# simulated analyst sessions over the same websocket protocol the browser
+# uses: each session loads the app, then moves the date range / as-of slider
+# and the series picker with some think time in between. Records rerun
+# latency percentiles, peak server RSS and Streamlit cache hit rates, and
+# writes a JSON report that can be compared between commits. Fully offline.
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashboard.py")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_DIR = "load_test_reports"
+
+ACTIONS = ["range", "as_of", "series", "reset"]
+RERUN_TIMEOUT = 120
+RSS_SAMPLE_INTERVAL = 0.05
+
+
+# ----------------------------------
+# Server side (runs in the Streamlit server process)
+# ----------------------------------
+def _install_cache_probe(stats_path):
+    """
+    Count st.cache_data / st.cache_resource hits and misses per cached
+    function and flush them to stats_path for the harness to read
+    """
+    from streamlit.runtime.caching.cache_utils import CachedFunc
+
+    stats = {}
+    lock = threading.Lock()
+    handle_hit = CachedFunc._handle_cache_hit
+    handle_miss = CachedFunc._handle_cache_miss
+
+    def record(func, field, seconds=0.0):
+        name = func._info.func.__qualname__
+        with lock:
+            entry = stats.setdefault(name, {"hits": 0, "misses": 0, "miss_time_s": 0.0})
+            entry[field] += 1
+            entry["miss_time_s"] += seconds
+
+    def probed_hit(self, result):
+        record(self, "hits")
+        return handle_hit(self, result)
+
+    def probed_miss(self, cache, value_key, func_args, func_kwargs):
+        start = time.perf_counter()
+        try:
+            return handle_miss(self, cache, value_key, func_args, func_kwargs)
+        finally:
+            record(self, "misses", time.perf_counter() - start)
+
+    CachedFunc._handle_cache_hit = probed_hit
+    CachedFunc._handle_cache_miss = probed_miss
+
+    def flush():
+        while True:
+            time.sleep(0.25)
+            with lock:
+                snapshot = json.dumps(stats)
+            with open(stats_path + ".tmp", "w") as f:
+                f.write(snapshot)
+            os.replace(stats_path + ".tmp", stats_path)
+
+    threading.Thread(target=flush, daemon=True).start()
+
+
+def _serve(app, port, stats_path):
+    _install_cache_probe(stats_path)
+
+    from streamlit.web import cli
+
+    sys.argv = [
+        "streamlit", "run", app,
+        "--server.headless", "true",
+        "--server.port", str(port),
+        "--server.fileWatcherType", "none",
+        "--browser.gatherUsageStats", "false",
+    ]
+    cli.main()
+
+
+# ----------------------------------
+# Client side (simulated sessions)
+# ----------------------------------
+class SimulatedSession:
+    """
+    One analyst session speaking Streamlit's websocket protocol
+    """
+
+    def __init__(self, url, rng):
+        self.url = url
+        self.rng = rng
+        self.ws = None
+        self.widgets = {}
+        self.states = {}
+        self.page_script_hash = ""
+        self.results = []
+
+    async def connect(self):
+        from tornado.websocket import websocket_connect
+
+        self.ws = await websocket_connect(self.url, subprotocols=["streamlit"])
+
+    def close(self):
+        if self.ws is not None:
+            self.ws.close()
+
+    async def rerun(self, action):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = self.page_script_hash
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+
+        start = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+
+        status, exceptions = "timeout", 0
+        try:
+            while True:
+                raw = await asyncio.wait_for(self.ws.read_message(), RERUN_TIMEOUT)
+                if raw is None:
+                    status = "disconnected"
+                    break
+
+                fwd = ForwardMsg()
+                fwd.ParseFromString(raw)
+                kind = fwd.WhichOneof("type")
+
+                if kind == "new_session":
+                    self.page_script_hash = fwd.new_session.page_script_hash
+                elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                    element = fwd.delta.new_element
+                    element_type = element.WhichOneof("type")
+                    if element_type in ("slider", "multiselect"):
+                        self.widgets[element_type] = getattr(element, element_type)
+                    elif element_type == "exception":
+                        exceptions += 1
+                elif kind == "script_finished":
+                    status = "ok" if fwd.script_finished == ForwardMsg.FINISHED_SUCCESSFULLY else "error"
+                    break
+        except asyncio.TimeoutError:
+            pass
+
+        self.results.append({
+            "action": action,
+            "latency_ms": (time.perf_counter() - start) * 1000,
+            "status": "error" if exceptions else status,
+        })
+
+    def choose_action(self):
+        """
+        Update widget states for a random interaction and return its name
+        """
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        action = self.rng.choice(ACTIONS)
+        slider = self.widgets.get("slider")
+        picker = self.widgets.get("multiselect")
+        n_months = len(slider.options) if slider else 0
+
+        if action in ("range", "as_of", "reset") and slider:
+            if action == "range":
+                lo = self.rng.randrange(0, n_months - 1)
+                hi = self.rng.randrange(lo + 1, n_months)
+            elif action == "as_of":
+                lo, hi = 0, self.rng.randrange(n_months // 2, n_months)
+            else:
+                lo, hi = 0, n_months - 1
+            state = WidgetState(id=slider.id)
+            state.double_array_value.data[:] = [lo, hi]
+            self.states[slider.id] = state
+
+        if action in ("series", "reset") and picker:
+            picked = [] if action == "reset" else self.rng.sample(list(picker.options), self.rng.randint(1, 3))
+            state = WidgetState(id=picker.id)
+            state.string_array_value.data[:] = picked
+            self.states[picker.id] = state
+
+        return action
+
+
+async def _session(url, steps, think_time, delay, seed):
+    await asyncio.sleep(delay)
+    session = SimulatedSession(url, random.Random(seed))
+    await session.connect()
+    try:
+        await session.rerun("load")
+        for _ in range(steps):
+            await asyncio.sleep(session.rng.uniform(0, think_time))
+            await session.rerun(session.choose_action())
+    finally:
+        session.close()
+    return session.results
+
+
+async def _run_sessions(url, sessions, steps, think_time, ramp_up, seed):
+    tasks = [
+        _session(url, steps, think_time, ramp_up * i / max(sessions, 1), seed + i)
+        for i in range(sessions)
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    reruns, failed_sessions = [], 0
+    for result in results:
+        if isinstance(result, Exception):
+            failed_sessions += 1
+        else:
+            reruns.extend(result)
+    return reruns, failed_sessions
+
+
+# ----------------------------------
+# Harness
+# ----------------------------------
+class _RssSampler(threading.Thread):
+    def __init__(self, pid):
+        super().__init__(daemon=True)
+        self.process = psutil.Process(pid)
+        self.peak = 0
+        self._done = threading.Event()
+
+    def current(self):
+        return self.process.memory_info().rss
+
+    def run(self):
+        while not self._done.is_set():
+            try:
+                self.peak = max(self.peak, self.current())
+            except psutil.NoSuchProcess:
+                return
+            time.sleep(RSS_SAMPLE_INTERVAL)
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+def _wait_for_server(port, process, timeout=60):
+    url = f"http://127.0.0.1:{port}/_stcore/health"
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("Streamlit server exited during start-up")
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"Streamlit server did not become healthy on port {port}")
+
+
+def _free_port():
+    import socket
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentiles(values):
+    if not values:
+        return {"count": 0}
+    values = np.asarray(values)
+    return {
+        "count": int(len(values)),
+        "mean": float(values.mean()),
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max()),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_load_test(sessions=24, steps=10, think_time=0.5, ramp_up=2.0, seed=0, app=APP_PATH, port=None):
+    """
+    Run the load test against a fresh local server and return the report dict
+    """
+    import streamlit
+
+    port = port or _free_port()
+    stats_path = os.path.join(tempfile.mkdtemp(prefix="st_load_"), "cache_stats.json")
+
+    server = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--serve", app,
+         "--port", str(port), "--cache-stats", stats_path],
+        cwd=REPO_ROOT,  # dashboard.py loads data/ relative to the repo root
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_for_server(port, server)
+        sampler = _RssSampler(server.pid)
+        rss_idle = sampler.current()
+        sampler.start()
+
+        url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        start = time.perf_counter()
+        reruns, failed_sessions = asyncio.run(
+            _run_sessions(url, sessions, steps, think_time, ramp_up, seed)
+        )
+        wall_time = time.perf_counter() - start
+
+        rss_end = sampler.current()
+        sampler.stop()
+        time.sleep(0.5)  # let the probe flush its final counts
+
+        cache = {}
+        if os.path.exists(stats_path):
+            with open(stats_path) as f:
+                cache = json.load(f)
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    ok = [r for r in reruns if r["status"] == "ok"]
+    by_action = {}
+    for r in ok:
+        by_action.setdefault(r["action"], []).append(r["latency_ms"])
+
+    for entry in cache.values():
+        lookups = entry["hits"] + entry["misses"]
+        entry["hit_rate"] = entry["hits"] / lookups if lookups else None
+    hits = sum(entry["hits"] for entry in cache.values())
+    lookups = hits + sum(entry["misses"] for entry in cache.values())
+
+    mb = 1024 * 1024
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {
+            "sessions": sessions,
+            "steps": steps,
+            "think_time_s": think_time,
+            "ramp_up_s": ramp_up,
+            "seed": seed,
+        },
+        "wall_time_s": wall_time,
+        "reruns": len(reruns),
+        "throughput_reruns_per_s": len(ok) / wall_time if wall_time else None,
+        "errors": {
+            "failed_sessions": failed_sessions,
+            "reruns": {
+                status: sum(r["status"] == status for r in reruns)
+                for status in ("error", "timeout", "disconnected")
+            },
+        },
+        "latency_ms": {
+            "all": _percentiles([r["latency_ms"] for r in ok]),
+            "by_action": {action: _percentiles(v) for action, v in sorted(by_action.items())},
+        },
+        "memory_mb": {
+            "rss_idle": rss_idle / mb,
+            "rss_peak": sampler.peak / mb,
+            "rss_end": rss_end / mb,
+            "rss_per_session": (sampler.peak - rss_idle) / mb / max(sessions, 1),
+        },
+        "cache": {
+            "hit_rate": hits / lookups if lookups else None,
+            "functions": cache,
+        },
+    }
+
+
+# ----------------------------------
+# Reporting
+# ----------------------------------
+COMPARE_METRICS = [
+    ("latency p50 (ms)", ("latency_ms", "all", "p50")),
+    ("latency p95 (ms)", ("latency_ms", "all", "p95")),
+    ("latency p99 (ms)", ("latency_ms", "all", "p99")),
+    ("throughput (reruns/s)", ("throughput_reruns_per_s",)),
+    ("peak RSS (MB)", ("memory_mb", "rss_peak")),
+    ("RSS per session (MB)", ("memory_mb", "rss_per_session")),
+    ("cache hit rate", ("cache", "hit_rate")),
+]
+
+
+def _lookup(report, path):
+    for key in path:
+        report = report.get(key) if isinstance(report, dict) else None
+    return report
+
+
+def format_report(report):
+    lines = [
+        f"commit {report['meta']['git_commit']} · {report['config']['sessions']} sessions × "
+        f"{report['config']['steps']} steps · {report['reruns']} reruns in {report['wall_time_s']:.1f}s",
+        f"errors: {report['errors']}",
+    ]
+    for name, path in COMPARE_METRICS:
+        value = _lookup(report, path)
+        lines.append(f"  {name:<24} {'n/a' if value is None else f'{value:,.3f}'}")
+    for action, stats in report["latency_ms"]["by_action"].items():
+        lines.append(f"  {action:<8} p50={stats['p50']:.1f} p95={stats['p95']:.1f} p99={stats['p99']:.1f} ms (n={stats['count']})")
+    for name, stats in report["cache"]["functions"].items():
+        rate = "n/a" if stats["hit_rate"] is None else f"{stats['hit_rate']:.1%}"
+        lines.append(f"  cache {name:<20} hits={stats['hits']} misses={stats['misses']} hit rate={rate}")
+    return "\n".join(lines)
+
+
+def compare_reports(base, new):
+    """
+    Side-by-side table of the headline metrics of two reports
+    """
+    lines = [
+        f"{'metric':<24} {'base ' + str(base['meta']['git_commit']):>16} {'new ' + str(new['meta']['git_commit']):>16} {'change':>9}"
+    ]
+    if base["config"] != new["config"]:
+        lines.append(f"warning: configs differ ({base['config']} vs {new['config']})")
+    for name, path in COMPARE_METRICS:
+        a, b = _lookup(base, path), _lookup(new, path)
+        change = f"{(b - a) / a:+.1%}" if a and b is not None else "n/a"
+        fmt = lambda v: "n/a" if v is None else f"{v:,.3f}"
+        lines.append(f"{name:<24} {fmt(a):>16} {fmt(b):>16} {change:>9}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the dashboard with concurrent simulated sessions")
+    parser.add_argument("--sessions", type=int, default=24)
+    parser.add_argument("--steps", type=int, default=10, help="interactions per session after the first load")
+    parser.add_argument("--think-time", type=float, default=0.5, help="max seconds between interactions")
+    parser.add_argument("--ramp-up", type=float, default=2.0, help="seconds over which sessions connect")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="report path (default load_test_reports/<commit>-<sessions>s.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="compare two saved reports")
+    # internal: run the probed Streamlit server
+    parser.add_argument("--serve", metavar="APP", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--cache-stats", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve, args.port, args.cache_stats)
+    elif args.compare:
+        with open(args.compare[0]) as f:
+            base = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+        print(compare_reports(base, new))
+    else:
+        report = run_load_test(
+            sessions=args.sessions,
+            steps=args.steps,
+            think_time=args.think_time,
+            ramp_up=args.ramp_up,
+            seed=args.seed,
+        )
+        out = args.out or os.path.join(
+            REPORT_DIR, f"{report['meta']['git_commit'] or 'local'}-{args.sessions}s.json"
+        )
+        os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+        with open(out, "w") as f:
+            json.dump(report, f, indent=2)
+
+        print(format_report(report))
+        print(f"Report saved to {out}")
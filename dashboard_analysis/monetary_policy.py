@@ -1,70 +1,98 @@
 import streamlit as st
 import plotly.express as px
+import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
 
-def monetary_policy_tab(df: pd.DataFrame):
+from dataset_schema import CPI_COMPONENTS, GDP_SECTORS
 
-    st.title("Monetary Policy (Bank of Korea)")
+# Interpretation boxes: (streamlit alert level, message)
+REGIME_MESSAGES = {
+    "stagflation": ("error", "Stagflation risk: Inflation remains high while growth weakens."),
+    "soft_landing": ("success", "Soft landing: Inflation easing with resilient growth."),
+    "mixed": ("info", "Mixed macro signals: Policy trade-offs remain."),
+}
 
-    df = df.copy()
-    df = df.sort_index()
 
-    # ==========================================================
-    # SECTION 1: MONETARY POLICY & INFLATION TARGETING
-    # ==========================================================
-    st.subheader("Monetary Policy & Inflation Targeting")
+def classify_policy(d_real):
+    if d_real > 0.10:
+        return "🟥 Hawkish ↑"
+    elif d_real < -0.10:
+        return "🟩 Dovish ↓"
+    else:
+        return "⚪ Neutral →"
+
+
+def add_forecast_band(fig, band: pd.DataFrame, name: str):
+    """
+    Overlay a forecast mean and its prediction interval on a plotly figure
+    """
+    fig.add_trace(go.Scatter(
+        x=band.index, y=band["upper"], mode="lines",
+        line=dict(width=0), showlegend=False, hoverinfo="skip"
+    ))
+    fig.add_trace(go.Scatter(
+        x=band.index, y=band["lower"], mode="lines",
+        line=dict(width=0), fill="tonexty", fillcolor="rgba(128, 128, 128, 0.2)",
+        name=f"{name} 95% band"
+    ))
+    fig.add_trace(go.Scatter(
+        x=band.index, y=band["mean"], mode="lines",
+        line=dict(dash="dot"), name=f"{name} forecast"
+    ))
+
+
+def policy_interpretation(d_real_rate):
+    if d_real_rate > 0.10:
+        return "error", "Policy is actively tightening financial conditions to combat inflation."
+    elif d_real_rate < -0.10:
+        return "success", "Policy is easing in real terms, supporting growth and liquidity."
+    else:
+        return "info", "Policy stance is broadly neutral; inflation dynamics are offsetting rate moves."
+
+
+def base_rate_cpi_figure(df: pd.DataFrame, forecasts: dict = None):
+    plot_ddf = df[["base_rate", "Total item"]].rename(columns={"base_rate": "Base Rate (%)", 
+                                                               "Total item": "CPI Inflation (YoY %)"})
+    fig = px.line(plot_ddf, x=plot_ddf.index, y=["Base Rate (%)", "CPI Inflation (YoY %)"],
+                title="Base Rate vs CPI Inflation",
+                labels={"index": "Date", "value": "Value", "variable": "Legend"})
+    fig.add_hline(
+        y=2.0, 
+        line_dash="dash", 
+        line_color="red", 
+        annotation_text="BOK Inflation Target (2%)", 
+        annotation_position="bottom right"
+    )
 
-    st.markdown("""
-    **BOK Mandate:** Price stability through inflation targeting.  
-    **Target:** 2% CPI inflation (YoY, medium-term).
+    # Precomputed forecast bands (fitted offline by forecasting.py)
+    for name, band in (forecasts or {}).items():
+        if band is not None:
+            add_forecast_band(fig, band, name)
 
-    The Base Rate is adjusted to anchor inflation expectations and stabilise growth.
-    """)
-
-    # --- Base Rate & CPI
-    def plot_base_rate_cpi(df):
-        plot_ddf = df[["base_rate", "Total item"]].rename(columns={"base_rate": "Base Rate (%)", 
-                                                                   "Total item": "CPI Inflation (YoY %)"})
-        fig = px.line(plot_ddf, x=plot_ddf.index, y=["Base Rate (%)", "CPI Inflation (YoY %)"],
-                    title="Base Rate vs CPI Inflation",
-                    labels={"index": "Date", "value": "Value", "variable": "Legend"})
-        fig.add_hline(
-            y=2.0, 
-            line_dash="dash", 
-            line_color="red", 
-            annotation_text="BOK Inflation Target (2%)", 
-            annotation_position="bottom right"
-        )
+    return fig
 
-        st.plotly_chart(fig, use_container_width=True)
-    
-    plot_base_rate_cpi(df)
 
-    # base rate vs cpi vs real rate metrics
-    df = df.copy()
-    df = df.sort_index()
+def policy_actions_table(df: pd.DataFrame, start=None) -> pd.DataFrame:
+    """
+    Months with a base rate move, with the real-rate stance at the time
+    """
+    # base rate vs cpi vs real rate metrics (copy only the columns we extend)
+    policy = df[["base_rate", "Total item"]].copy()
 
     # Levels
-    df["real_rate"] = df["base_rate"] - df["Total item"]
+    policy["real_rate"] = policy["base_rate"] - policy["Total item"]
 
     # Changes (MoM)
-    df["d_base_rate"] = df["base_rate"].diff()
-    df["d_cpi"] = df["Total item"].diff()
-    df["d_real_rate"] = df["real_rate"].diff()
+    policy["d_base_rate"] = policy["base_rate"].diff()
+    policy["d_cpi"] = policy["Total item"].diff()
+    policy["d_real_rate"] = policy["real_rate"].diff()
 
-    def classify_policy(d_real):
-        if d_real > 0.10:
-            return "🟥 Hawkish ↑"
-        elif d_real < -0.10:
-            return "🟩 Dovish ↓"
-        else:
-            return "⚪ Neutral →"
-
-    df["policy_stance"] = df["d_real_rate"].apply(classify_policy)
+    policy = policy.loc[start:]
+    policy["policy_stance"] = policy["d_real_rate"].apply(classify_policy)
 
     # policy decision table
-    policy_moves = df[df["d_base_rate"] != 0][
+    policy_moves = policy[policy["d_base_rate"] != 0][
         [
             "base_rate", "Total item", "real_rate",
             "d_base_rate", "d_cpi", "d_real_rate",
@@ -72,25 +100,97 @@ def monetary_policy_tab(df: pd.DataFrame):
         ]
     ]
 
-    if not policy_moves.empty:
-        st.subheader("📌 Monetary Policy Actions & Real Stance")
+    return policy_moves.rename(columns={
+        "base_rate": "Base Rate (%)",
+        "Total item": "CPI (YoY, %)",
+        "real_rate": "Real Rate (%)",
+        "d_base_rate": "Δ Base Rate",
+        "d_cpi": "Δ CPI",
+        "d_real_rate": "Δ Real Rate",
+        "policy_stance": "Policy Classification"
+    })
+
+
+def zscore_signals(df: pd.DataFrame, start=None) -> pd.DataFrame:
+    cols = [
+        "Total item",
+        "Expectations of Interest Rates",
+        "Composite Consumer Sentiment Index",
+    ]
+
+    # Standardise over the full as-of history so a month's value does not
+    # move with the displayed range, then limit to rows from start
+    z_df = df[cols].dropna()
+    return ((z_df - z_df.mean()) / z_df.std()).loc[start:]
+
+
+def cpi_breakdown_table(df: pd.DataFrame) -> pd.DataFrame:
+    return (
+        df[CPI_COMPONENTS]
+        .iloc[-1]
+        .to_frame(name="Inflation (%)")
+        .sort_values("Inflation (%)", ascending=False)
+    )
+
+
+def sector_growth_table(df: pd.DataFrame) -> pd.DataFrame:
+    gdp_growth = df[GDP_SECTORS].pct_change(periods=3) * 100
+
+    return (
+        gdp_growth
+        .iloc[-1]
+        .to_frame(name="3-Month Growth (%)")
+        .sort_values("3-Month Growth (%)", ascending=False)
+    )
+
+
+def monetary_policy_tab(df: pd.DataFrame, state: dict = None, forecasts: dict = None, start=None,
+                        var_forecasts: dict = None):
+
+    st.title("Monetary Policy (Bank of Korea)")
+
+    # df is a read-only view; charts and tables are limited to rows from start
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+
+    # ==========================================================
+    # SECTION 1: MONETARY POLICY & INFLATION TARGETING
+    # ==========================================================
+    st.subheader("Monetary Policy & Inflation Targeting")
+
+    st.markdown("""
+    **BOK Mandate:** Price stability through inflation targeting.  
+    **Target:** 2% CPI inflation (YoY, medium-term).
+
+    The Base Rate is adjusted to anchor inflation expectations and stabilise growth.
+    """)
 
-        display_df = policy_moves.rename(columns={
-            "base_rate": "Base Rate (%)",
-            "Total item": "CPI (YoY, %)",
-            "real_rate": "Real Rate (%)",
-            "d_base_rate": "Δ Base Rate",
-            "d_cpi": "Δ CPI",
-            "d_real_rate": "Δ Real Rate",
-            "policy_stance": "Policy Classification"
-        })
+    # --- Base Rate & CPI (bands from the univariate fits or the joint VAR)
+    if var_forecasts and any(band is not None for band in var_forecasts.values()):
+        model = st.radio(
+            "Forecast model",
+            ["ARIMA / ETS (per series)", "VAR (base rate, CPI, GDP growth)"],
+            horizontal=True,
+        )
+        if model.startswith("VAR"):
+            forecasts = var_forecasts
+
+    st.plotly_chart(base_rate_cpi_figure(df.loc[start:], forecasts), use_container_width=True)
+
+    # policy decision table
+    display_df = policy_actions_table(df, start)
+
+    if not display_df.empty:
+        st.subheader("📌 Monetary Policy Actions & Real Stance")
 
         st.dataframe(display_df, use_container_width=True)
 
-    # policy metrics (current)
-    latest = df.iloc[-1]
+    # policy metrics (current, precomputed when replaying history)
+    if state is None:
+        state = compute_policy_state(df)
 
-    stance = classify_policy(latest["d_real_rate"])
+    latest = state
+    stance = state["stance"]
 
     arrow = "🔺" if latest["d_real_rate"] > 0.10 else "🔻" if latest["d_real_rate"] < -0.10 else "➡️"
 
@@ -98,7 +198,7 @@ def monetary_policy_tab(df: pd.DataFrame):
 
     c1.metric(
         "As of Date",
-        latest.name.strftime("%B %Y")
+        latest["as_of"]
     )
 
     c2.metric(
@@ -126,12 +226,8 @@ def monetary_policy_tab(df: pd.DataFrame):
 
     # interpretation
     st.subheader("Policy Interpretation")
-    if latest["d_real_rate"] > 0.10:
-        st.error("Policy is actively tightening financial conditions to combat inflation.")
-    elif latest["d_real_rate"] < -0.10:
-        st.success("Policy is easing in real terms, supporting growth and liquidity.")
-    else:
-        st.info("Policy stance is broadly neutral; inflation dynamics are offsetting rate moves.")
+    level, message = policy_interpretation(latest["d_real_rate"])
+    getattr(st, level)(message)
 
     st.divider()
 
@@ -140,17 +236,8 @@ def monetary_policy_tab(df: pd.DataFrame):
     # ==========================================================
     st.subheader("Inflation Expectations vs Actual Inflation")
 
-    cols = [
-        "Total item",
-        "Expectations of Interest Rates",
-        "Composite Consumer Sentiment Index",
-    ]
-
-    z_df = df[cols].dropna().copy()
-    z_df = (z_df - z_df.mean()) / z_df.std()
-
     st.subheader("Standardised Macro Signals (Z-Score)")
-    st.line_chart(z_df)
+    st.line_chart(zscore_signals(df, start))
 
     st.caption(
         "Policy credibility improves when inflation expectations stabilise despite elevated CPI."
@@ -163,29 +250,7 @@ def monetary_policy_tab(df: pd.DataFrame):
     # ==========================================================
     st.subheader("Inflation Breakdown (Latest YoY %)")
 
-    cpi_components = [
-        'Alcoholic beverages and tobacco',
-        'Clothing and footwear',
-        'Communication',
-        'Education',
-        'Food and non-alcoholic beverages',
-        'Furnishings, household equipment and routine household maintenance',
-        'Health',
-        'Housing, water, electricity and other fuels',
-        'Miscellaneous goods and services',
-        'Recreation and culture',
-        'Restaurants and hotels',
-        'Transport'
-    ]
-
-    cpi_table = (
-        df[cpi_components]
-        .iloc[-1]
-        .to_frame(name="Inflation (%)")
-        .sort_values("Inflation (%)", ascending=False)
-    )
-
-    st.dataframe(cpi_table, use_container_width=True)
+    st.dataframe(cpi_breakdown_table(df), use_container_width=True)
 
     st.divider()
 
@@ -194,49 +259,53 @@ def monetary_policy_tab(df: pd.DataFrame):
     # ==========================================================
     st.subheader("Growth by Sector (3-Month % Change)")
 
-    gdp_sectors = ['Accommodation and food services', 'Arts, sports and recreation', 
-                   'Basic metals', 'Building repair', 'Business support services', 
-                   'Chemicals and chemical products', 'Coke and refined petroleum products', 
-                   'Communication', 'Computer, electronic and optical products', 'Electrical equipment',
-                   'Fabricated metal products', 'Food, beverages products', 'Machinery and equipment', 
-                   'Non-metallic mineral products', 'Non-residential building construction', 
-                   'Other manufacturing, repair and installation of machinery and equipment', 
-                   'Professional, scientific and technical services', 'Publishing, broadcasting, motion picture, video and television programme production, and information service', 
-                   'Residential building construction', 'Textile and leather products', 'Transportation equipment', 'Wholesale and retail trade', 
-                   'Wood and paper products, printing and reproduction of recorded media', 'Building construction and repair', 'Business activities', 
-                   'Civil engineering', 'Cultural and other services', 'Education', 'Electricity', 'Finance and insurance', 'Gas, steam and air conditioning supply', 
-                   'Human health and social work', 'Information and communication', 'Manufacturing', 'Public administration, defence and social security', 'Real estate', 
-                   'Transportation and storage', 'Water supply, sewerage, waste management and remediation activities', 'Wholesale and retail trade, accommodation and food services', 
-                   'Agriculture, forestry and fishing', 'Construction', 'Electricity, gas and water supply', 'Gross domestic product at market prices(GDP)', 'Gross national income(GNI)', 
-                   'Mining, quarrying and Manufacturing', 'Net factor income from the rest of the world'
-    ]
-
-    gdp_growth = df[gdp_sectors].pct_change(periods=3) * 100
-
-    gdp_growth_table = (
-        gdp_growth
-        .iloc[-1]
-        .to_frame(name="3-Month Growth (%)")
-        .sort_values("3-Month Growth (%)", ascending=False)
-    )
-
-    st.dataframe(gdp_growth_table, use_container_width=True)
+    st.dataframe(sector_growth_table(df), use_container_width=True)
 
     # ==========================================================
     # SECTION 5: MACRO REGIME SUMMARY
     # ==========================================================
     st.subheader("Macro–Policy Regime Summary")
 
+    level, message = REGIME_MESSAGES[state["regime"]]
+    getattr(st, level)(message)
+
+
+def compute_policy_state(df: pd.DataFrame) -> dict:
+    """
+    Compute the latest policy metrics, stance and macro regime for the last month in df
+    """
+    rates = df[["base_rate", "Total item"]].sort_index()
+    real_rate = rates["base_rate"] - rates["Total item"]
+
+    latest = rates.iloc[-1]
+    d_base_rate = rates["base_rate"].diff().iloc[-1]
+    d_cpi = rates["Total item"].diff().iloc[-1]
+    d_real_rate = real_rate.diff().iloc[-1]
+
     latest_gdp_growth = (
         df["Gross domestic product at market prices(GDP)"]
+        .sort_index()
         .pct_change(periods=3)
         .iloc[-1] * 100
     )
 
     if latest["Total item"] > 3 and latest_gdp_growth < 1:
-        st.error("Stagflation risk: Inflation remains high while growth weakens.")
+        regime = "stagflation"
     elif latest["Total item"] < 2 and latest_gdp_growth > 2:
-        st.success("Soft landing: Inflation easing with resilient growth.")
+        regime = "soft_landing"
     else:
-        st.info("Mixed macro signals: Policy trade-offs remain.")
+        regime = "mixed"
+
+    return {
+        "as_of": latest.name.strftime("%B %Y"),
+        "base_rate": latest["base_rate"],
+        "Total item": latest["Total item"],
+        "real_rate": real_rate.iloc[-1],
+        "d_base_rate": d_base_rate,
+        "d_cpi": d_cpi,
+        "d_real_rate": d_real_rate,
+        "stance": classify_policy(d_real_rate),
+        "gdp_growth_3m": latest_gdp_growth,
+        "regime": regime,
+    }
 
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+# ----------------------------------
+# Indexed date-range & series queries
+# ----------------------------------
+# Widget changes (date range, series picker) go through MacroQuery instead of
+# boolean-masking the full frame. Date bounds are resolved by binary search
+# on the sorted index and selections are views on the loaded data, so a query
+# costs O(selected data) rather than O(full frame).
+
+
+class MacroQuery:
+    """
+    Read-only query layer over the cleaned dataset
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        df = df.sort_index()
+
+        self._df = df
+        self.index = df.index
+        self.columns = list(df.columns)
+
+        # Precomputed date -> position and column -> position lookups
+        self._dates = df.index.values
+        self._positions = {col: i for i, col in enumerate(df.columns)}
+        self._arrays = {col: df.iloc[:, i].to_numpy() for col, i in self._positions.items()}
+
+    @property
+    def start(self):
+        return self.index[0]
+
+    @property
+    def end(self):
+        return self.index[-1]
+
+    def bounds(self, start=None, end=None):
+        """
+        Positions [i, j) of the rows between start and end (inclusive)
+        """
+        i = 0 if start is None else np.searchsorted(self._dates, np.datetime64(start), side="left")
+        j = len(self._dates) if end is None else np.searchsorted(self._dates, np.datetime64(end), side="right")
+        return int(i), int(max(i, j))
+
+    def rows(self, start=None, end=None) -> pd.DataFrame:
+        """
+        All columns between start and end, as a view on the dataset
+        """
+        i, j = self.bounds(start, end)
+        return self._df.iloc[i:j]
+
+    def select(self, columns, start=None, end=None) -> pd.DataFrame:
+        """
+        The given columns between start and end, built from per-column views
+        """
+        i, j = self.bounds(start, end)
+        missing = [col for col in columns if col not in self._positions]
+        if missing:
+            raise KeyError(f"Unknown series: {missing}")
+
+        return pd.DataFrame(
+            {col: self._arrays[col][i:j] for col in columns},
+            index=self.index[i:j],
+            copy=False,
+        )
+
+    def series(self, column, start=None, end=None) -> pd.Series:
+        """
+        One column between start and end, as a view on the dataset
+        """
+        i, j = self.bounds(start, end)
+        return pd.Series(self._arrays[column][i:j], index=self.index[i:j], name=column, copy=False)
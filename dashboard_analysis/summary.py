@@ -1,16 +1,11 @@
 import streamlit as st
 import pandas as pd
 
+from dataset_schema import SUMMARY_COLUMNS as COLS
 
-def summary_tab(df):
-    st.header("🇰🇷 Korea Macro Summary")
 
-    COLS = {
-        "rate": "base_rate",
-        "cpi": "Total item",
-        "gdp": "Gross domestic product at market prices(GDP)",
-        "debt": "govt_debt_to_gdp"
-    }
+def summary_tab(df, state=None, explorer=None):
+    st.header("🇰🇷 Korea Macro Summary")
 
     # ---------------------------
     # 2. Guard against missing required columns
@@ -24,43 +19,21 @@ def summary_tab(df):
             return # Stop execution if data is missing
 
     # ---------------------------
-    # 3. Compute latest values and changes directly from the main df
+    # 3. Latest values and changes (precomputed when replaying history)
     # ---------------------------
+    if state is None:
+        state = compute_summary_state(df)
+
+    rate_now = state["rate_now"]
+    rate_change = state["rate_change"]
+    cpi_now = state["cpi_now"]
+    cpi_change = state["cpi_change"]
+    gdp_now = state["gdp_now"]
+    gdp_change_quarterly = state["gdp_change_quarterly"]
+    debt_now = state["debt_now"]
+    debt_change_quarterly = state["debt_change_quarterly"]
+    curr_date = state["as_of"]
 
-    # Policy Rate Calculations
-    rate_series = df[COLS["rate"]].dropna()
-    rate_now = rate_series.iloc[-1]
-    rate_prev = rate_series.iloc[-2]
-    rate_change = rate_now - rate_prev
-
-    # CPI Calculations
-    cpi_series = df[COLS["cpi"]].dropna()
-    cpi_now = cpi_series.iloc[-1]
-    cpi_prev = cpi_series.iloc[-2]
-    cpi_change = cpi_now - cpi_prev
-
-
-    # GDP Calculations (guard against missing optional columns if necessary, otherwise assume they exist)
-    if COLS["gdp"] in df.columns:
-        gdp_series = df[COLS["gdp"]].dropna()
-        gdp_now = gdp_series.iloc[-1]
-        gdp_prev_quarter = gdp_series.iloc[-4] # Assumes quarterly data aligned with index frequency
-        gdp_change_quarterly = (gdp_now - gdp_prev_quarter) / gdp_prev_quarter * 100
-    else:
-        gdp_now, gdp_change_quarterly = None, None # Handle gracefully in your display logic
-
-    # Debt Calculations
-    if COLS["debt"] in df.columns:
-        debt_series = df[COLS["debt"]].dropna()
-        debt_now = debt_series.iloc[-1]
-        debt_prev_quarter = debt_series.iloc[-4]
-        debt_change_quarterly = (debt_now - debt_prev_quarter) / debt_prev_quarter * 100
-    else:
-        debt_now, debt_change_quarterly = None, None
-
-    # Get the current date from the index of the rate series
-    curr_date = rate_series.index[-1].strftime("%B %Y")
-    
     # ---------------------------
     # 4. KPI row
     # ---------------------------
@@ -95,39 +68,98 @@ def summary_tab(df):
     st.divider()
 
     # ---------------------------
-    # 5. Macro regime logic
+    # 5. Macro regime & narrative summary (regime computed in compute_summary_state)
     # ---------------------------
-    real_rate = rate_now - cpi_now
+    st.subheader("📌 Key Takeaways")
 
-    if real_rate > 0:
-        stance = "Restrictive"
-    elif real_rate < 0:
-        stance = "Accommodative"
-    else:
-        stance = "Neutral"
+    st.markdown(key_takeaways(state))
 
-    inflation_trend = "Cooling" if cpi_change < 0 else "Re-accelerating"
+    st.info(summary_narrative(state))
 
     # ---------------------------
-    # 6. Narrative summary
+    # 6. Series explorer (sidebar series picker)
     # ---------------------------
-    st.subheader("📌 Key Takeaways")
+    if explorer is not None and not explorer.empty:
+        st.subheader("📈 Series Explorer")
+        st.line_chart(explorer)
 
-    st.markdown(
-        f"""
-        - **Real Policy Rate:** {real_rate:.2f}%  
-        - **Monetary Policy Stance:** {stance}  
-        - **Inflation Trend:** {inflation_trend}
+
+def key_takeaways(state):
+    return f"""
+        - **Real Policy Rate:** {state["real_rate"]:.2f}%  
+        - **Monetary Policy Stance:** {state["stance"]}  
+        - **Inflation Trend:** {state["inflation_trend"]}
         """
-    )
 
-    st.info(
-        f"""
-        Korea’s monetary environment remains **{stance.lower()}**, with
-        the base policy rate exceeding inflation by **{real_rate:.2f}%**.
-        Inflation dynamics suggest **{inflation_trend.lower()} pressures**,
+
+def summary_narrative(state):
+    return f"""
+        Korea’s monetary environment remains **{state["stance"].lower()}**, with
+        the base policy rate exceeding inflation by **{state["real_rate"]:.2f}%**.
+        Inflation dynamics suggest **{state["inflation_trend"].lower()} pressures**,
         implying a cautious policy path ahead.
         """
-    )
 
 
+def compute_summary_state(df):
+    """
+    Compute the Summary KPIs and regime for the last month in df
+    """
+
+    # Policy Rate Calculations
+    rate_series = df[COLS["rate"]].dropna()
+    rate_now = rate_series.iloc[-1]
+    rate_prev = rate_series.iloc[-2]
+    rate_change = rate_now - rate_prev
+
+    # CPI Calculations
+    cpi_series = df[COLS["cpi"]].dropna()
+    cpi_now = cpi_series.iloc[-1]
+    cpi_prev = cpi_series.iloc[-2]
+    cpi_change = cpi_now - cpi_prev
+
+    # GDP Calculations (guard against missing optional columns if necessary, otherwise assume they exist)
+    if COLS["gdp"] in df.columns:
+        gdp_series = df[COLS["gdp"]].dropna()
+        gdp_now = gdp_series.iloc[-1]
+        gdp_prev_quarter = gdp_series.iloc[-4] # Assumes quarterly data aligned with index frequency
+        gdp_change_quarterly = (gdp_now - gdp_prev_quarter) / gdp_prev_quarter * 100
+    else:
+        gdp_now, gdp_change_quarterly = None, None # Handle gracefully in your display logic
+
+    # Debt Calculations
+    if COLS["debt"] in df.columns:
+        debt_series = df[COLS["debt"]].dropna()
+        debt_now = debt_series.iloc[-1]
+        debt_prev_quarter = debt_series.iloc[-4]
+        debt_change_quarterly = (debt_now - debt_prev_quarter) / debt_prev_quarter * 100
+    else:
+        debt_now, debt_change_quarterly = None, None
+
+    # Macro regime logic
+    real_rate = rate_now - cpi_now
+
+    if real_rate > 0:
+        stance = "Restrictive"
+    elif real_rate < 0:
+        stance = "Accommodative"
+    else:
+        stance = "Neutral"
+
+    inflation_trend = "Cooling" if cpi_change < 0 else "Re-accelerating"
+
+    return {
+        # Get the current date from the index of the rate series
+        "as_of": rate_series.index[-1].strftime("%B %Y"),
+        "rate_now": rate_now,
+        "rate_change": rate_change,
+        "cpi_now": cpi_now,
+        "cpi_change": cpi_change,
+        "gdp_now": gdp_now,
+        "gdp_change_quarterly": gdp_change_quarterly,
+        "debt_now": debt_now,
+        "debt_change_quarterly": debt_change_quarterly,
+        "real_rate": real_rate,
+        "stance": stance,
+        "inflation_trend": inflation_trend,
+    }
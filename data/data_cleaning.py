@@ -1,6 +1,25 @@
+import os
+import subprocess
+import sys
+import time
+
 import pandas as pd
 import numpy as np
 
+from data_validation import DataValidationError, check_sources, coerce_numeric, format_coverage
+from vintage_store import record_vintage
+
+etl_start = time.perf_counter()
+
+# Months the dashboard publishes. The merge keeps only months that every source
+# covers: a month missing inside a source always fails validation, while sources
+# that start late or end early are only reported unless ETL_EXPECTED_START /
+# ETL_EXPECTED_END set the window explicitly, in which case they fail.
+START_DATE = os.environ.get("ETL_EXPECTED_START", "2018-01-01")
+END_DATE = os.environ.get("ETL_EXPECTED_END", "2025-12-31")
+WINDOW_EXPLICIT = "ETL_EXPECTED_START" in os.environ or "ETL_EXPECTED_END" in os.environ
+
+
 df_bok = pd.read_csv(r'C:\Users\User\Documents\NUS\Projects\NUSSIF\data\BOK Base rate MoM.csv')
 df_cpi = pd.read_csv(r'C:\Users\User\Documents\NUS\Projects\NUSSIF\data\Consumer Price indices MoM.csv')
 df_cts = pd.read_csv(r'C:\Users\User\Documents\NUS\Projects\NUSSIF\data\Consumer Tendency Survey MoM.csv')
@@ -37,18 +56,17 @@ def clean_data(data: pd.DataFrame):
     data.index = pd.to_datetime(data.index)
 
     # clean numeric columns
-    data[:] = (
-        data.astype(str)
-            .replace({",": "", " ": ""}, regex=True)
-            .replace({"-": None, "": None, "nan": None})
-            .apply(pd.to_numeric, errors="coerce")
-    )
+    numeric, coercion_failures = coerce_numeric(data)
+    data[:] = numeric
 
     # clean column names
     data.columns = (
         data.columns
         .str.strip()        # remove leading/trailing spaces
     ) 
+
+    # keep unparseable-cell counts for the validation stage
+    data.attrs["coercion_failures"] = coercion_failures.set_axis(data.columns)
     return data
 
 # --------------------------------------------
@@ -64,6 +82,36 @@ for df in quarterly_data:
 for df in full_data:
     df = clean_data(df)
 
+# --------------------------------------------
+# Validate sources before the merge (fail fast with a report)
+validation_start = time.perf_counter()
+sources = {
+    "BOK Base rate": (df_bok, "M"),
+    "Consumer Price indices": (df_cpi, "M"),
+    "Consumer Tendency Survey": (df_cts, "M"),
+    "House Price Index": (df_house, "M"),
+    "Trade of KTB Bond": (df_ktb, "M"),
+    "KOSPI KOSDAQ": (df_kospi, "M"),
+    "Debt securities": (df_debt, "Q"),
+    "NPISH consumption": (df_npish, "Q"),
+    "GDP and GNI": (df_gdp, "Q"),
+    "Expenditures on GDP": (df_expense, "Q"),
+    "Tax collection": (df_tax, "Y"),
+    "NPS asset allocation": (df_nps_percent, "Y"),
+    "Exchange Rate (daily)": (df_fx, "M"),  # checked for monthly coverage
+}
+try:
+    validation_report, coverage = check_sources(
+        sources, window=(START_DATE, END_DATE), enforce_window=WINDOW_EXPLICIT
+    )
+except DataValidationError as e:
+    print(e.report.to_string())
+    print(format_coverage(e.coverage))
+    raise
+validation_time = time.perf_counter() - validation_start
+print(validation_report.to_string())
+print(("WARNING: " if coverage["months_lost"] else "") + format_coverage(coverage))
+
 # clean data into monthly frequency
 # daily to monthly
 df_fx_monthly    = df_fx.resample("MS").mean()
@@ -113,10 +161,57 @@ full_df_monthly = df
 
 
 # Final Data Filtering and Export
-full_df_monthly = full_df_monthly.loc["2018-01-01":"2025-12-31"]
+full_df_monthly = full_df_monthly.loc[START_DATE:END_DATE]
 full_df_monthly = full_df_monthly.dropna()
 
 # Save the final cleaned DataFrame to a CSV file
 full_df_monthly.to_csv("cleaned_full_data.csv", index=True)
 
+# Record this release in the append-only vintage store (only revised cells are stored)
+vintage = record_vintage(full_df_monthly, note="data_cleaning.py")
+print(f"Recorded data vintage v{vintage}")
+
 print(full_df_monthly.columns.tolist())
+
+etl_time = time.perf_counter() - etl_start
+print(
+    f"[bench] validation: {validation_time * 1000:.1f} ms "
+    f"({validation_time / etl_time:.1%} of {etl_time * 1000:.1f} ms ETL)"
+)
+
+# Precompute the point-in-time dashboard state table (as-of replay).
+# Runs as its own process so the pool workers do not re-import this script.
+subprocess.run(
+    [
+        sys.executable,
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dashboard_analysis", "as_of.py"),
+        "cleaned_full_data.csv",
+        "dashboard_state.csv",
+    ],
+    check=True,
+)
+
+# Fit forecast models (reusing cached fits for unchanged series) and write forecast bands
+subprocess.run(
+    [
+        sys.executable,
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dashboard_analysis", "forecasting.py"),
+        "cleaned_full_data.csv",
+        "forecasts.csv",
+        "--cache", "forecast_models.json",
+    ],
+    check=True,
+)
+
+# Export the static HTML snapshot of the dashboard for this dataset version
+subprocess.run(
+    [
+        sys.executable,
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dashboard_analysis", "export_static.py"),
+        "cleaned_full_data.csv",
+        os.path.join("..", "exports"),
+        "--forecasts", "forecasts.csv",
+        "--cache", "forecast_models.json",
+    ],
+    check=True,
+)
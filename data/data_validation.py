@@ -0,0 +1,306 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# --------------------------------------------
+# Data-quality gate (runs before the merge)
+# --------------------------------------------
+# Each cleaned source frame is checked in one vectorised pass: DatetimeIndex
+# frequency, gaps and duplicated dates, cells that failed numeric coercion,
+# value ranges, the months it covers, and the columns each dashboard tab
+# needs. Any error stops the ETL with a report before the merge and export,
+# instead of surfacing later as silently dropped months or KeyErrors in the
+# dashboard.
+
+# Columns each dashboard tab reads (after the header clean-up in clean_data),
+# from the pandas-only schema module the tabs themselves import
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dashboard_analysis"))
+from dataset_schema import CPI_COMPONENTS, DEBT_COLUMNS, GDP_SECTORS, SUMMARY_COLUMNS  # noqa: E402
+
+TAB_REQUIRED_COLUMNS = {
+    "Summary": [
+        SUMMARY_COLUMNS["rate"],
+        SUMMARY_COLUMNS["cpi"],
+        SUMMARY_COLUMNS["gdp"],
+        # inputs to govt_debt_to_gdp (engineered after the merge)
+        "Central Government -   Domestic Market",
+        "Central Government -   Foreign Market",
+    ],
+    # dict.fromkeys: a few names are both CPI components and GDP sectors
+    "Monetary & Inflation": list(dict.fromkeys([
+        SUMMARY_COLUMNS["rate"],
+        SUMMARY_COLUMNS["cpi"],
+        "Expectations of Interest Rates",
+        "Composite Consumer Sentiment Index",
+        *CPI_COMPONENTS,
+        *GDP_SECTORS,
+    ])),
+    "Fiscal & Debt": list(DEBT_COLUMNS.values()),
+}
+
+# Plausible ranges for headline series; other columns only need finite values
+VALUE_RANGES = {
+    "base_rate": (0, 10),
+    "Total item": (-5, 15),
+    "Composite Consumer Sentiment Index": (0, 200),
+    "Present Debt of Household": (0, 200),
+    "Gross domestic product at market prices(GDP)": (0, np.inf),
+    "domestic_equity": (0, 100),
+    "domestic_fixed_income": (0, 100),
+    "global_equity": (0, 100),
+    "global_fixed_income": (0, 100),
+}
+
+# Checks that fail the ETL; the rest of the report is informational
+ERROR_CHECKS = [
+    "not_datetime_index",
+    "duplicated_dates",
+    "missing_periods",
+    "coercion_failures",
+    "out_of_range",
+    "interior_months_lost",
+]
+
+
+class DataValidationError(Exception):
+    def __init__(self, report, missing_required, coverage=None):
+        self.report = report
+        self.missing_required = missing_required
+        self.coverage = coverage
+
+        failed = report.index[report["status"] == "FAIL"].tolist()
+        message = f"Data validation failed for: {failed}" if failed else "Data validation failed"
+        if coverage and coverage["months_lost"]:
+            message += f"; {format_coverage(coverage)}"
+        if missing_required:
+            message += f"; missing columns by tab: {missing_required}"
+        super().__init__(message)
+
+
+def coerce_numeric(data):
+    """
+    Strip thousands separators/blanks and coerce every column to numeric.
+    Returns the numeric frame and, per column, the number of cells that held
+    a value but could not be parsed (these would otherwise become silent NaN).
+    """
+    normalized = (
+        data.astype(str)
+            .replace({",": "", " ": ""}, regex=True)
+            .replace({"-": None, "": None, "nan": None})
+    )
+    numeric = normalized.apply(pd.to_numeric, errors="coerce")
+    failures = (normalized.notna() & numeric.isna()).sum()
+    return numeric, failures
+
+
+def _month(date):
+    return pd.Period(date, freq="M")
+
+
+def _months_outside(first, last, window):
+    """
+    Months of window (a pair of monthly Periods) outside [first, last]
+    """
+    start, end = window
+    total = end.ordinal - start.ordinal + 1
+    if first is None or first > last:
+        return total
+    before = min(first.ordinal, end.ordinal + 1) - start.ordinal
+    after = end.ordinal - max(last.ordinal, start.ordinal - 1)
+    return min(total, max(0, before) + max(0, after))
+
+
+def validate_frame(data, freq, window=None):
+    """
+    Run every check on one cleaned source frame.
+    freq is the period ("Y", "Q", "M") each date must be present for;
+    daily sources are checked for monthly coverage.
+    window is the (start, end) of the merged output. The merge drops every
+    month missing any column, so a source covers the months from its latest
+    first value to its earliest last value across columns, less the interior
+    months in which some column has no value.
+    """
+    index = data.index
+    result = {
+        "rows": len(data),
+        "columns": data.shape[1],
+        "start": None,
+        "end": None,
+        "not_datetime_index": int(not isinstance(index, pd.DatetimeIndex)),
+        "duplicated_dates": 0,
+        "missing_periods": 0,
+        "coercion_failures": int(data.attrs.get("coercion_failures", pd.Series(dtype=int)).sum()),
+        "out_of_range": 0,
+        "rows_with_missing": 0,
+        "coverage_start": None,
+        "coverage_end": None,
+        "merge_months_lost": 0,
+        "interior_months_lost": 0,
+        "dropped_months": "",
+    }
+    if result["not_datetime_index"]:
+        return result
+
+    window = None if window is None else (_month(window[0]), _month(window[1]))
+    if data.empty:
+        result["merge_months_lost"] = _months_outside(None, None, window) if window else 0
+        return result
+
+    result["start"] = index.min().strftime("%Y-%m-%d")
+    result["end"] = index.max().strftime("%Y-%m-%d")
+
+    # Index checks
+    result["duplicated_dates"] = int(index.duplicated().sum())
+    periods = index.to_period(freq)
+    expected = pd.period_range(periods.min(), periods.max(), freq=freq)
+    result["missing_periods"] = int(len(expected.difference(periods.unique())))
+
+    # Value checks in one pass over the numeric block
+    values = data.to_numpy(dtype=float, na_value=np.nan)
+    lower = np.array([VALUE_RANGES.get(col, (-np.inf, np.inf))[0] for col in data.columns])
+    upper = np.array([VALUE_RANGES.get(col, (-np.inf, np.inf))[1] for col in data.columns])
+    missing = np.isnan(values)
+    bad = ~missing & ((values < lower) | (values > upper) | np.isinf(values))
+    result["out_of_range"] = int(bad.sum())
+    result["rows_with_missing"] = int(missing.any(axis=1).sum())
+
+    # Coverage once resampled to monthly (period starts, as the merge resamples to "MS")
+    first = last = None
+    valid = ~missing
+    if data.shape[1] and valid.any(axis=0).all():
+        months = index.to_period("M").asi8[:, None]
+        first = pd.Period(ordinal=int(np.where(valid, months, np.iinfo(np.int64).max).min(axis=0).max()), freq="M")
+        last = pd.Period(ordinal=int(np.where(valid, months, np.iinfo(np.int64).min).max(axis=0).min()), freq="M")
+        result["coverage_start"] = first.strftime("%Y-%m")
+        result["coverage_end"] = last.strftime("%Y-%m")
+    if window is not None:
+        result["merge_months_lost"] = _months_outside(first, last, window)
+
+    # Interior gaps: a period in which some column has no value leaves its
+    # months empty after the monthly resample (yearly sources are
+    # interpolated to monthly, so only their edges matter)
+    if first is not None and freq != "Y":
+        by_period = pd.DataFrame(valid, index=periods).groupby(level=0).any()
+        gaps = by_period.index[~by_period.all(axis=1)]
+        lo = first if window is None else max(first, window[0])
+        hi = last if window is None else min(last, window[1])
+        dropped = [
+            pd.Period(ordinal=month, freq="M").strftime("%Y-%m")
+            for gap in gaps
+            for month in range(
+                max(gap.asfreq("M", "start").ordinal, lo.ordinal),
+                min(gap.asfreq("M", "end").ordinal, hi.ordinal) + 1,
+            )
+        ]
+        result["interior_months_lost"] = len(dropped)
+        result["dropped_months"] = ", ".join(dropped)
+
+    return result
+
+
+def merge_coverage(report, window):
+    """
+    Months the merged frame keeps out of window: the common coverage of all
+    sources (latest start to earliest end), the sources that set each edge,
+    the interior months some source is missing, and the total months lost
+    """
+    start, end = _month(window[0]), _month(window[1])
+    starts = report["coverage_start"].map(lambda d: None if d is None else _month(d))
+    ends = report["coverage_end"].map(lambda d: None if d is None else _month(d))
+
+    empty = report.index[starts.isna()].tolist()
+    if empty or report.empty:
+        first = last = None
+        limited_by = {"no coverage": empty}
+    else:
+        first, last = max(starts.max(), start), min(ends.min(), end)
+        limited_by = {
+            "start": report.index[starts == first].tolist() if first > start else [],
+            "end": report.index[ends == last].tolist() if last < end else [],
+        }
+
+    covered = first is not None and first <= last
+    dropped = sorted({
+        month
+        for months in report["dropped_months"] if months
+        for month in months.split(", ")
+        if covered and first <= _month(month) <= last
+    })
+    edge_months_lost = _months_outside(first, last, (start, end))
+
+    return {
+        "window": (start.strftime("%Y-%m"), end.strftime("%Y-%m")),
+        "coverage": (first.strftime("%Y-%m"), last.strftime("%Y-%m")) if covered else None,
+        "edge_months_lost": edge_months_lost,
+        "limited_by": {edge: names for edge, names in limited_by.items() if names},
+        "dropped_months": dropped,
+        "months_lost": edge_months_lost + len(dropped),
+    }
+
+
+def format_coverage(coverage):
+    window = " to ".join(coverage["window"])
+    if coverage["coverage"] is None:
+        return f"merge keeps no months of {window} (limited by {coverage['limited_by']})"
+    if not coverage["months_lost"]:
+        return f"merge covers {window}"
+
+    kept = " to ".join(coverage["coverage"])
+    lost = []
+    if coverage["edge_months_lost"]:
+        lost.append(f"{coverage['edge_months_lost']} at the edges (limited by {coverage['limited_by']})")
+    if coverage["dropped_months"]:
+        lost.append(f"{len(coverage['dropped_months'])} inside ({', '.join(coverage['dropped_months'])})")
+    return f"merge keeps {kept} and loses {coverage['months_lost']} months of {window}: {'; '.join(lost)}"
+
+
+def validate_sources(sources, required=TAB_REQUIRED_COLUMNS, window=None, enforce_window=False):
+    """
+    Validate every source frame and the tab column contract.
+    sources maps a source name to (frame, freq); window is the (start, end)
+    of the merged frame. Interior months lost always fail the source; with
+    enforce_window the sources that cut the window short at either edge
+    fail too, otherwise that shortfall is only reported.
+    Returns (report, missing_required, coverage); coverage is None without a window.
+    """
+    report = pd.DataFrame.from_dict(
+        {name: validate_frame(data, freq, window) for name, (data, freq) in sources.items()},
+        orient="index",
+    )
+    failed = (report[ERROR_CHECKS] > 0).any(axis=1)
+
+    coverage = None
+    if window is not None:
+        coverage = merge_coverage(report, window)
+        if enforce_window:
+            # Only the sources that set the merged window's edges
+            limiting = [name for names in coverage["limited_by"].values() for name in names]
+            failed |= report.index.isin(limiting)
+    report["status"] = np.where(failed, "FAIL", "ok")
+
+    # Tab requirements: present in some source and not entirely empty
+    available = set()
+    for data, _ in sources.values():
+        available.update(data.columns[data.notna().any().to_numpy()])
+    missing_required = {
+        tab: [col for col in cols if col not in available]
+        for tab, cols in required.items()
+    }
+    missing_required = {tab: cols for tab, cols in missing_required.items() if cols}
+
+    return report, missing_required, coverage
+
+
+def check_sources(sources, required=TAB_REQUIRED_COLUMNS, window=None, enforce_window=False):
+    """
+    Validate the sources and raise DataValidationError with the report on any
+    error (see validate_sources for which lost months count as errors).
+    Returns (report, coverage); coverage is None without a window.
+    """
+    report, missing_required, coverage = validate_sources(sources, required, window, enforce_window)
+
+    if (report["status"] == "FAIL").any() or missing_required:
+        raise DataValidationError(report, missing_required, coverage)
+    return report, coverage
@@ -0,0 +1,273 @@
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+# One content hash for the whole project (dashboard_analysis/dataset_schema.py,
+# pandas-only); vintages, forecast caches, state tables and exports share it
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dashboard_analysis"))
+from dataset_schema import dataset_version  # noqa: E402
+
+# --------------------------------------------
+# Append-only vintage store for data releases
+# --------------------------------------------
+# Every ETL run is recorded as a new version instead of overwriting the
+# previous release. Version 1 (and every SNAPSHOT_EVERY-th version) is a full
+# snapshot; every other version only stores the cells that changed against
+# the prior version, so storage and bytes written scale with the size of the
+# revisions. Files are never rewritten: the manifest is an append-only JSONL
+# log and each version gets its own file.
+
+VINTAGE_DIR = "vintages"
+MANIFEST = "manifest.jsonl"
+SNAPSHOT_EVERY = 25
+
+
+def _dates(index):
+    return [d.strftime("%Y-%m-%d") for d in index]
+
+
+def _dedupe_columns(columns):
+    # Same renaming read_csv applies to repeated headers ("Education", "Education.1"),
+    # so in-memory ETL frames diff cleanly against stored snapshots
+    seen = {}
+    deduped = []
+    for col in columns:
+        count = seen.get(col, 0)
+        seen[col] = count + 1
+        deduped.append(col if count == 0 else f"{col}.{count}")
+    return deduped
+
+
+def list_vintages(store_dir=VINTAGE_DIR):
+    """
+    Manifest entries for every recorded version, oldest first
+    """
+    path = os.path.join(store_dir, MANIFEST)
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _read_snapshot(store_dir, entry, columns=None):
+    return pd.read_csv(
+        os.path.join(store_dir, entry["file"]),
+        index_col="date",
+        parse_dates=["date"],
+        usecols=None if columns is None else lambda col: col == "date" or col in columns,
+        float_precision="round_trip",  # exact reads, so unchanged cells never diff
+    )
+
+
+def _read_cells(store_dir, entry):
+    return pd.read_csv(
+        os.path.join(store_dir, entry["file"]),
+        parse_dates=["date"],
+        dtype={"column": str, "value": float},
+        float_precision="round_trip",
+    )
+
+
+def _apply_delta(df, entry, cells):
+    """
+    Apply one delta version on top of the prior vintage
+    """
+    df = df.drop(
+        index=pd.to_datetime(entry["removed_rows"]),
+        columns=entry["removed_columns"],
+    )
+    if entry["columns"] is not None:
+        df = df.reindex(columns=entry["columns"])
+    df = df.reindex(df.index.union(pd.to_datetime(entry["added_rows"])))
+
+    if cells.empty:
+        return df
+
+    values = df.to_numpy(dtype=float, copy=True)
+    rows = df.index.get_indexer(cells["date"])
+    cols = df.columns.get_indexer(cells["column"])
+    values[rows, cols] = cells["value"].to_numpy()
+    return pd.DataFrame(values, index=df.index, columns=df.columns)
+
+
+def _diff(old, new):
+    """
+    Cells of new that differ from old, plus the row/column changes
+    """
+    common_rows = new.index.intersection(old.index)
+    common_cols = new.columns.intersection(old.columns, sort=False)
+    added_rows = new.index.difference(old.index)
+    added_cols = new.columns.difference(old.columns, sort=False)
+
+    # Revised cells among rows/columns present in both versions (one vectorised pass)
+    a = old.loc[common_rows, common_cols].to_numpy(dtype=float)
+    b = new.loc[common_rows, common_cols].to_numpy(dtype=float)
+    changed = ~((a == b) | (np.isnan(a) & np.isnan(b)))
+    r, c = np.nonzero(changed)
+    parts = [pd.DataFrame({
+        "date": common_rows[r],
+        "column": common_cols[c],
+        "value": b[r, c],
+    })]
+
+    # New cells: whole new rows, and new columns on existing rows
+    for block in (new.loc[added_rows], new.loc[common_rows, added_cols]):
+        stacked = block.stack(future_stack=True).dropna()
+        if not stacked.empty:
+            parts.append(pd.DataFrame({
+                "date": stacked.index.get_level_values(0),
+                "column": stacked.index.get_level_values(1),
+                "value": stacked.to_numpy(dtype=float),
+            }))
+
+    cells = pd.concat(parts, ignore_index=True)
+    meta = {
+        "added_rows": _dates(added_rows),
+        "removed_rows": _dates(old.index.difference(new.index)),
+        "removed_columns": list(old.columns.difference(new.columns, sort=False)),
+        # Only stored when the column layout changed
+        "columns": None if list(new.columns) == list(old.columns) else list(new.columns),
+    }
+    return cells, meta
+
+
+def load_vintage(version=None, store_dir=VINTAGE_DIR):
+    """
+    Reconstruct a vintage (latest if version is None) from the nearest
+    snapshot at or before it plus the deltas recorded since
+    """
+    entries = list_vintages(store_dir)
+    if not entries:
+        raise FileNotFoundError(f"No vintages recorded in {store_dir}")
+
+    version = entries[-1]["version"] if version is None else version
+    if not 1 <= version <= len(entries):
+        raise KeyError(f"Unknown vintage version: {version}")
+
+    entries = entries[:version]
+    base = max(i for i, entry in enumerate(entries) if entry["kind"] == "snapshot")
+
+    df = _read_snapshot(store_dir, entries[base])
+    for entry in entries[base + 1:]:
+        df = _apply_delta(df, entry, _read_cells(store_dir, entry))
+    df.index.name = "date"
+    return df
+
+
+def revision_history(column, store_dir=VINTAGE_DIR):
+    """
+    Value of one series in every vintage (rows = dates, columns = versions).
+    Only the series' column is parsed from snapshots; delta files hold just
+    the revised cells and are filtered to the series after reading.
+    """
+    history = {}
+    series = None
+
+    for entry in list_vintages(store_dir):
+        if entry["kind"] == "snapshot":
+            snapshot = _read_snapshot(store_dir, entry, columns=[column])
+            series = snapshot[column] if column in snapshot.columns else pd.Series(dtype=float)
+        else:
+            dropped = pd.to_datetime(entry["removed_rows"])
+            if column in entry["removed_columns"]:
+                series = pd.Series(dtype=float)
+            series = series.drop(index=dropped, errors="ignore")
+            series = series.reindex(series.index.union(pd.to_datetime(entry["added_rows"])))
+
+            cells = _read_cells(store_dir, entry)
+            cells = cells[cells["column"] == column]
+            if not cells.empty:
+                series = series.reindex(series.index.union(cells["date"]))
+                series.loc[cells["date"]] = cells["value"].to_numpy()
+
+        history[entry["version"]] = series
+
+    frame = pd.DataFrame(history)
+    frame.index.name = "date"
+    return frame
+
+
+def record_vintage(df, store_dir=VINTAGE_DIR, note=None):
+    """
+    Append df as a new version and return its version number
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    entries = list_vintages(store_dir)
+    version = len(entries) + 1
+
+    df = df.sort_index()
+    df.index = pd.to_datetime(df.index)
+    df.index.name = "date"
+    df.columns = _dedupe_columns(df.columns)
+
+    entry = {
+        "version": version,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "note": note,
+        "shape": list(df.shape),
+        "dataset_hash": dataset_version(df),
+    }
+
+    if not entries or (version - 1) % SNAPSHOT_EVERY == 0:
+        entry.update(kind="snapshot", file=f"v{version:06d}_snapshot.csv", n_cells=int(df.size))
+        df.to_csv(os.path.join(store_dir, entry["file"]), index=True)
+    elif entries[-1]["dataset_hash"] == entry["dataset_hash"]:
+        # Unchanged release: record the run with an empty delta
+        entry.update(
+            kind="delta", file=f"v{version:06d}_delta.csv", n_cells=0,
+            added_rows=[], removed_rows=[], removed_columns=[], columns=None,
+        )
+        pd.DataFrame(columns=["date", "column", "value"]).to_csv(
+            os.path.join(store_dir, entry["file"]), index=False
+        )
+    else:
+        previous = load_vintage(version - 1, store_dir)
+        cells, meta = _diff(previous, df)
+        entry.update(kind="delta", file=f"v{version:06d}_delta.csv", n_cells=len(cells), **meta)
+        cells["date"] = _dates(pd.DatetimeIndex(cells["date"]))
+        cells.to_csv(os.path.join(store_dir, entry["file"]), index=False)
+
+    # Append-only manifest: one JSON line per version
+    with open(os.path.join(store_dir, MANIFEST), "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+    return version
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect the data vintage store")
+    parser.add_argument("--store", default=VINTAGE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="List recorded versions")
+
+    show = sub.add_parser("show", help="Reconstruct a vintage to CSV")
+    show.add_argument("version", type=int)
+    show.add_argument("out_path")
+
+    history = sub.add_parser("history", help="Revision history of one series")
+    history.add_argument("column")
+    history.add_argument("--out", default=None)
+
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for entry in list_vintages(args.store):
+            print(
+                f"v{entry['version']:<4} {entry['created']}  {entry['kind']:<8} "
+                f"{entry['n_cells']:>7} cells  shape={tuple(entry['shape'])}  {entry['note'] or ''}"
+            )
+    elif args.command == "show":
+        load_vintage(args.version, args.store).to_csv(args.out_path, index=True)
+        print(f"Saved vintage {args.version} to {args.out_path}")
+    else:
+        revisions = revision_history(args.column, args.store)
+        if args.out:
+            revisions.to_csv(args.out, index=True)
+        else:
+            print(revisions.to_string())